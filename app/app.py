@@ -33,7 +33,8 @@ class WorkflowBuilderApp:
         
         # Initialize core components first
         self.theme_manager = ThemeManager()
-        self.workflow_engine = WorkflowEngine()
+        # WORKFLOW_BUILDER_DEBUG=0 drops DEBUG entries (tracebacks, data transfers) from run logs
+        self.workflow_engine = WorkflowEngine(debug=os.environ.get("WORKFLOW_BUILDER_DEBUG", "1") != "0")
         self.file_manager = FileManager()
         
         # Initialize main window reference
@@ -45,6 +45,10 @@ class WorkflowCanvas(ctk.CTkFrame):
         self.pan_offset = Point(0, 0)
         self.unsaved_changes = False
         
+        # Edit counters; the serializer reuses work for nodes whose revision is unchanged
+        self.revision = 0
+        self.node_revisions: Dict[str, int] = {}
+        
         # Node factory for creating nodes
         self.node_factory = NodeFactory()
         
@@ -589,7 +593,7 @@ class WorkflowCanvas(ctk.CTkFrame):
             self._draw_node(node_id)
             self._redraw_node_connections(node_id)
             
-            self._mark_changed()
+            self._mark_changed(node_id)
     
     def _redraw_node_connections(self, node_id: str):
         """Redraw all connections for a node."""
@@ -656,6 +660,7 @@ class WorkflowCanvas(ctk.CTkFrame):
         # Remove the node
         self.canvas.delete(f"node_{node_id}")
         del self.nodes[node_id]
+        self.node_revisions.pop(node_id, None)
         
         # Clear selection if this node was selected
         if self.selected_node == node_id:
@@ -663,9 +668,15 @@ class WorkflowCanvas(ctk.CTkFrame):
         
         self._mark_changed()
     
-    def _mark_changed(self):
-        """Mark the canvas as having unsaved changes."""
+    def _mark_changed(self, node_id: Optional[str] = None):
+        """Mark the canvas as having unsaved changes.
+        
+        Pass node_id when a node's data was modified in place.
+        """
         self.unsaved_changes = True
+        self.revision += 1
+        if node_id is not None:
+            self.node_revisions[node_id] = self.revision
         self.on_canvas_changed()
     
     def _apply_zoom(self):
@@ -678,6 +689,8 @@ class WorkflowCanvas(ctk.CTkFrame):
         self.canvas.delete("all")
         self.nodes.clear()
         self.connections.clear()
+        self.node_revisions.clear()
+        self.revision += 1
         self.selected_node = None
         self.hovered_node = None
         self.unsaved_changes = False
@@ -703,7 +716,9 @@ class WorkflowCanvas(ctk.CTkFrame):
             "canvas_state": {
                 "zoom_level": self.zoom_level,
                 "pan_offset": {"x": self.pan_offset.x, "y": self.pan_offset.y}
-            }
+            },
+            "revision": self.revision,
+            "node_revisions": self.node_revisions
         }
     
     def load_workflow(self, workflow_data: Dict):
@@ -742,7 +757,7 @@ class WorkflowCanvas(ctk.CTkFrame):
                 self.nodes[node_id]["properties"] = {}
             
             self.nodes[node_id]["properties"][property_name] = value
-            self._mark_changed()
+            self._mark_changed(node_id)
     
     def update_node_status(self, node_id: str, status: str):
         """Update the execution status of a node."""
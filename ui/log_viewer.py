@@ -5,7 +5,7 @@ Provides filtered logging, auto-scroll, and export functionality.
 
 import customtkinter as ctk
 import tkinter as tk
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from datetime import datetime
 import threading
 import queue
@@ -235,6 +235,18 @@ class LogViewer(ctk.CTkFrame):
         # Add to queue for processing
         self.log_queue.put(entry)
     
+    def add_logs(self, events: List[Tuple]):
+        """Add a batch of (level, message, node_id, details) log events (thread-safe)."""
+        timestamp = datetime.now()
+        for level, message, node_id, details in events:
+            self.log_queue.put(LogEntry(
+                timestamp=timestamp,
+                level=level,
+                message=message,
+                node_id=node_id,
+                details=details
+            ))
+    
     def _add_log_entry_internal(self, entry: LogEntry):
         """Add log entry to internal storage."""
         self.log_entries.append(entry)
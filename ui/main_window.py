@@ -239,13 +239,21 @@ class MainWindow(ctk.CTk):
             return
         
         workflow_data = self.canvas.get_workflow_data()
-        self.workflow_engine.execute_workflow(
+        # Never block the UI thread waiting for a free execution slot
+        execution_id = self.workflow_engine.execute_workflow(
             workflow_data,
             on_log=self.log_viewer.add_log,
             on_node_update=self.canvas.update_node_status,
-            on_complete=self._on_workflow_complete
+            on_complete=self._on_workflow_complete,
+            on_log_batch=self.log_viewer.add_logs,
+            wait=False
         )
         
+        if execution_id is None:
+            self.update_status("Workflow engine busy, execution not started")
+            messagebox.showwarning("Warning", "Too many workflow executions are pending. Try again later.")
+            return
+        
         self.update_status("Workflow execution started...")
         self.toolbar.set_execution_state(True)
     
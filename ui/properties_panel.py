@@ -8,6 +8,16 @@ import tkinter as tk
 from typing import Dict, Any, Callable, Optional, List
 from app.themes import ThemeManager
 
+# Static glyphs reused on every render
+_ARROW_DOWN, _ARROW_RIGHT = "▼", "▶"
+_PIN_ICON = "🔌"
+
+
+def _pin_texts(pins: List[Dict]) -> List[str]:
+    """Build the display text for a list of pins."""
+    return [f"{pin['name']} ({pin.get('type', 'any')})" for pin in pins]
+
+
 class PropertiesPanel(ctk.CTkFrame):
     """Modern properties panel with dynamic property editors."""
     
@@ -120,9 +130,10 @@ class PropertiesPanel(ctk.CTkFrame):
         id_frame.pack(fill="x", padx=10, pady=2)
         
         ctk.CTkLabel(id_frame, text="ID:", width=80, anchor="w").pack(side="left")
+        short_id = str(node_data.get("id") or "Unknown")[:12] + "..."
         id_label = ctk.CTkLabel(
             id_frame,
-            text=node_data.get("id", "Unknown")[:12] + "...",
+            text=short_id,
             anchor="w",
             font=("Courier", 9)
         )
@@ -189,7 +200,7 @@ class PropertiesPanel(ctk.CTkFrame):
         
         expand_btn = ctk.CTkButton(
             header_frame,
-            text="▼" if self.advanced_expanded else "▶",
+            text=_ARROW_DOWN if self.advanced_expanded else _ARROW_RIGHT,
             width=30,
             height=25,
             command=lambda: self._toggle_advanced_section(expand_btn, content_frame)
@@ -236,16 +247,16 @@ class PropertiesPanel(ctk.CTkFrame):
             )
             inputs_label.pack(anchor="w", padx=20, pady=(5, 2))
             
-            for input_pin in inputs:
+            for pin_text in _pin_texts(inputs):
                 pin_frame = ctk.CTkFrame(connections_frame, fg_color="transparent")
                 pin_frame.pack(fill="x", padx=30, pady=1)
                 
-                pin_icon = ctk.CTkLabel(pin_frame, text="🔌", width=20)
+                pin_icon = ctk.CTkLabel(pin_frame, text=_PIN_ICON, width=20)
                 pin_icon.pack(side="left")
                 
                 pin_label = ctk.CTkLabel(
                     pin_frame,
-                    text=f"{input_pin['name']} ({input_pin.get('type', 'any')})",
+                    text=pin_text,
                     anchor="w"
                 )
                 pin_label.pack(side="left", padx=5)
@@ -260,16 +271,16 @@ class PropertiesPanel(ctk.CTkFrame):
             )
             outputs_label.pack(anchor="w", padx=20, pady=(10, 2))
             
-            for output_pin in outputs:
+            for pin_text in _pin_texts(outputs):
                 pin_frame = ctk.CTkFrame(connections_frame, fg_color="transparent")
                 pin_frame.pack(fill="x", padx=30, pady=(1, 10))
                 
-                pin_icon = ctk.CTkLabel(pin_frame, text="🔌", width=20)
+                pin_icon = ctk.CTkLabel(pin_frame, text=_PIN_ICON, width=20)
                 pin_icon.pack(side="left")
                 
                 pin_label = ctk.CTkLabel(
                     pin_frame,
-                    text=f"{output_pin['name']} ({output_pin.get('type', 'any')})",
+                    text=pin_text,
                     anchor="w"
                 )
                 pin_label.pack(side="left", padx=5)
@@ -504,10 +515,10 @@ class PropertiesPanel(ctk.CTkFrame):
         self.advanced_expanded = not getattr(self, 'advanced_expanded', False)
         
         if self.advanced_expanded:
-            expand_btn.configure(text="▼")
+            expand_btn.configure(text=_ARROW_DOWN)
             content_frame.pack(fill="x", padx=5, pady=(0, 5))
         else:
-            expand_btn.configure(text="▶")
+            expand_btn.configure(text=_ARROW_RIGHT)
             content_frame.pack_forget()
     
     def clear_properties(self):
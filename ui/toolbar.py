@@ -3,8 +3,11 @@ Modern toolbar with gradient styling and smooth animations.
 Provides workflow controls and theme switching.
 """
 
+import functools
+import itertools
+
 import customtkinter as ctk
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 from app.themes import ThemeManager
 
 class Toolbar(ctk.CTkFrame):
@@ -27,9 +30,14 @@ class Toolbar(ctk.CTkFrame):
         self.on_toggle_theme = on_toggle_theme
         
         self.execution_running = False
+        self._cached_colors: Optional[Dict[str, str]] = None
+        self._pulse_cycle: Optional[itertools.cycle] = None
+        self._pulse_after_id: Optional[str] = None
         
         self._create_toolbar_sections()
         self._setup_layout()
+        self._setup_button_hover_effects()
+        self._bake_status_colors(self._colors())
         
     def _create_toolbar_sections(self):
         """Create different sections of the toolbar."""
@@ -111,6 +119,7 @@ class Toolbar(ctk.CTkFrame):
             command=self.on_toggle_theme,
             corner_radius=8
         )
+        self._view_button_count = 1  # Columns used in view_frame
         
         # Status section (right-aligned)
         self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -168,9 +177,21 @@ class Toolbar(ctk.CTkFrame):
         # Prevent frame from shrinking
         self.grid_propagate(False)
     
+    def _colors(self) -> Dict[str, str]:
+        """Get the cached theme colors (refreshed by apply_theme)."""
+        colors = self._cached_colors
+        if colors is None:
+            colors = self._refresh_colors()
+        return colors
+    
+    def _refresh_colors(self) -> Dict[str, str]:
+        """Reload the color palette from the theme manager."""
+        self._cached_colors = self.theme_manager.get_current_theme()["colors"]
+        return self._cached_colors
+    
     def apply_theme(self):
         """Apply the current theme to toolbar elements."""
-        colors = self.theme_manager.get_current_theme()["colors"]
+        colors = self._refresh_colors()
         
         # Update toolbar background
         self.configure(fg_color=colors["toolbar_bg"])
@@ -180,50 +201,41 @@ class Toolbar(ctk.CTkFrame):
         self.separator2.configure(fg_color=colors["panel_border"])
         
         # Update status indicator color based on execution state
-        if self.execution_running:
-            self.status_indicator.configure(text_color=colors["info"])
-        else:
-            self.status_indicator.configure(text_color=colors["success"])
+        self._bake_status_colors(colors)
+        self.status_indicator.configure(text_color=self._status_color())
         
         # Update title color
         self.title_label.configure(text_color=colors["text_primary"])
-        
-        # Update button hover effects
-        self._setup_button_hover_effects()
+    
+    def _bake_status_colors(self, colors: Dict[str, str]):
+        """Cache the status indicator color for each execution state."""
+        self._status_color_ready = colors["success"]
+        self._status_color_running = colors["info"]
+        
+        # A running pulse switches to the new palette on its next tick
+        if self.execution_running and self._pulse_cycle is not None:
+            self._pulse_cycle = self._make_pulse_cycle(colors)
+    
+    def _status_color(self) -> str:
+        """Get the status indicator color for the current execution state."""
+        return self._status_color_running if self.execution_running else self._status_color_ready
     
     def _setup_button_hover_effects(self):
-        """Setup hover effects for toolbar buttons."""
-        colors = self.theme_manager.get_current_theme()["colors"]
-        
-        buttons = [
+        """Setup hover effects for toolbar buttons (bound once at construction)."""
+        self._hover_buttons = (
             self.new_btn, self.open_btn, self.save_btn, self.save_as_btn,
             self.run_btn, self.stop_btn, self.theme_btn
-        ]
+        )
         
-        for button in buttons:
+        for button in self._hover_buttons:
             # Add hover animation
-            button.bind("<Enter>", lambda e, btn=button: self._on_button_hover(btn, True))
-            button.bind("<Leave>", lambda e, btn=button: self._on_button_hover(btn, False))
+            button.bind("<Enter>", functools.partial(self._on_button_hover, button, True))
+            button.bind("<Leave>", functools.partial(self._on_button_hover, button, False))
     
-    def _on_button_hover(self, button: ctk.CTkButton, is_hover: bool):
-        """Handle button hover animations."""
-        colors = self.theme_manager.get_current_theme()["colors"]
-        
-        if is_hover:
-            # Smooth scale animation
-            self._animate_button_scale(button, 1.05)
-        else:
-            # Return to normal scale
-            self._animate_button_scale(button, 1.0)
-    
-    def _animate_button_scale(self, button: ctk.CTkButton, scale: float):
-        """Animate button scaling effect."""
-        # Simple scaling effect using configure
-        # In a more advanced implementation, this could use actual animations
-        if scale > 1.0:
-            button.configure(border_width=2)
-        else:
-            button.configure(border_width=0)
+    def _on_button_hover(self, button: ctk.CTkButton, is_hover: bool, event=None):
+        """Handle button hover highlight."""
+        # The highlight is a plain on/off border, so set it directly
+        button.configure(border_width=2 if is_hover else 0)
     
     def set_execution_state(self, running: bool):
         """Update the execution state of the toolbar."""
@@ -232,35 +244,36 @@ class Toolbar(ctk.CTkFrame):
         if running:
             self.run_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
-            self.status_indicator.configure(text="● Running")
+            self.status_indicator.configure(text="● Running", text_color=self._status_color())
             
             # Add pulse animation to status
-            self._pulse_status_indicator()
+            self._start_status_pulse()
         else:
             self.run_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
-            self.status_indicator.configure(text="● Ready")
+            self.status_indicator.configure(text="● Ready", text_color=self._status_color())
+    
+    def _start_status_pulse(self):
+        """Start pulsing the status indicator while execution is running."""
+        if self._pulse_after_id is not None:
+            self.after_cancel(self._pulse_after_id)
         
-        # Update colors
-        self.apply_theme()
+        self._pulse_cycle = self._make_pulse_cycle(self._colors())
+        self._pulse_after_id = self.after(500, self._pulse_tick)
+    
+    def _make_pulse_cycle(self, colors: Dict[str, str]) -> itertools.cycle:
+        """Build the status pulse colors for a palette."""
+        # Alternate between bright and normal colors, starting from normal
+        return itertools.cycle((colors["accent_hover"], colors["info"]))
     
-    def _pulse_status_indicator(self):
-        """Add a pulsing animation to the status indicator when running."""
+    def _pulse_tick(self):
+        """Advance the status indicator pulse by one step."""
+        self._pulse_after_id = None
         if self.execution_running:
-            colors = self.theme_manager.get_current_theme()["colors"]
-            
-            # Alternate between normal and bright colors
-            current_color = str(self.status_indicator.cget("text_color"))
-            
-            if current_color == colors["info"]:
-                new_color = colors["accent_hover"]
-            else:
-                new_color = colors["info"]
-            
-            self.status_indicator.configure(text_color=new_color)
+            self.status_indicator.configure(text_color=next(self._pulse_cycle))
             
             # Schedule next pulse
-            self.after(500, self._pulse_status_indicator)
+            self._pulse_after_id = self.after(500, self._pulse_tick)
     
     def update_title(self, title: str):
         """Update the toolbar title."""
@@ -292,9 +305,9 @@ class Toolbar(ctk.CTkFrame):
                 corner_radius=8
             )
             
-            # Get current column count and add button
-            column_count = len(self.view_frame.grid_slaves())
-            button.grid(row=0, column=column_count, padx=2)
+            # Place after the existing view buttons
+            button.grid(row=0, column=self._view_button_count, padx=2)
+            self._view_button_count += 1
             
             return button
         
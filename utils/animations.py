@@ -4,23 +4,51 @@ Provides easing functions, animation controllers, and visual effects.
 """
 
 import math
+import re
 import time
-import threading
-from typing import Callable, Optional, Any, Dict, List
+import weakref
+from typing import Callable, Optional, Any, Dict, List, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
-class EasingType(Enum):
-    """Easing function types for animations."""
-    LINEAR = "linear"
-    EASE_IN = "ease_in"
-    EASE_OUT = "ease_out"
-    EASE_IN_OUT = "ease_in_out"
-    ELASTIC = "elastic"
-    BOUNCE = "bounce"
-    SPRING = "spring"
+class EasingType(IntEnum):
+    """Easing function types for animations (values index _EASING_TABLE)."""
+    LINEAR = 0
+    EASE_IN = 1
+    EASE_OUT = 2
+    EASE_IN_OUT = 3
+    ELASTIC = 4
+    BOUNCE = 5
+    SPRING = 6
+    PULSE = 7
 
-@dataclass
+# Precomputed easing constants
+_ELASTIC_C4 = (2 * math.pi) / 3
+
+_BOUNCE_N1 = 7.5625
+_BOUNCE_T1 = 1 / 2.75
+_BOUNCE_T2 = 2 / 2.75
+_BOUNCE_T3 = 2.5 / 2.75
+_BOUNCE_1_5 = 1.5 / 2.75
+_BOUNCE_2_25 = 2.25 / 2.75
+_BOUNCE_2_625 = 2.625 / 2.75
+
+_SPRING_TENSION = 100
+_SPRING_FRICTION = 10
+_SPRING_OMEGA = math.sqrt(_SPRING_TENSION)
+_SPRING_ZETA = _SPRING_FRICTION / (2 * _SPRING_OMEGA)
+_SPRING_OMEGA_D = _SPRING_OMEGA * math.sqrt(1 - _SPRING_ZETA * _SPRING_ZETA)
+
+# Sentinel for properties a widget doesn't have yet
+_NO_ATTR = object()
+
+# Widget reference plus property name for property animations
+_PropertyTarget = Tuple[Callable[[], Any], str]
+
+# Animations shorter than one 60 FPS frame never show an intermediate value
+_MIN_FRAME_TIME = 1.0 / 60
+
+@dataclass(slots=True)
 class AnimationFrame:
     """Represents a single frame in an animation."""
     time: float
@@ -70,60 +98,87 @@ class EasingFunctions:
         return 1 - pow(-2 * t + 2, 3) / 2
     
     @staticmethod
-    def elastic_out(t: float) -> float:
+    def elastic_out(t: float, _sin=math.sin) -> float:
         """Elastic ease-out."""
         if t == 0:
             return 0
         if t == 1:
             return 1
         
-        c4 = (2 * math.pi) / 3
-        return pow(2, -10 * t) * math.sin((t * 10 - 0.75) * c4) + 1
+        return pow(2, -10 * t) * _sin((t * 10 - 0.75) * _ELASTIC_C4) + 1
     
     @staticmethod
     def bounce_out(t: float) -> float:
         """Bounce ease-out."""
-        n1 = 7.5625
-        d1 = 2.75
+        n1 = _BOUNCE_N1
         
-        if t < 1 / d1:
+        if t < _BOUNCE_T1:
             return n1 * t * t
-        elif t < 2 / d1:
-            return n1 * (t - 1.5 / d1) * t + 0.75
-        elif t < 2.5 / d1:
-            return n1 * (t - 2.25 / d1) * t + 0.9375
+        elif t < _BOUNCE_T2:
+            return n1 * (t - _BOUNCE_1_5) * t + 0.75
+        elif t < _BOUNCE_T3:
+            return n1 * (t - _BOUNCE_2_25) * t + 0.9375
         else:
-            return n1 * (t - 2.625 / d1) * t + 0.984375
+            return n1 * (t - _BOUNCE_2_625) * t + 0.984375
     
     @staticmethod
-    def spring(t: float, tension: float = 100, friction: float = 10) -> float:
+    def spring(t: float, tension: float = _SPRING_TENSION, friction: float = _SPRING_FRICTION,
+               _exp=math.exp, _cos=math.cos) -> float:
         """Spring animation with configurable tension and friction."""
-        # Simplified spring physics
-        omega = math.sqrt(tension)
-        zeta = friction / (2 * math.sqrt(tension))
+        # Simplified spring physics; the default spring uses precomputed constants
+        if tension == _SPRING_TENSION and friction == _SPRING_FRICTION:
+            omega = _SPRING_OMEGA
+            zeta = _SPRING_ZETA
+            omega_d = _SPRING_OMEGA_D
+        else:
+            omega = math.sqrt(tension)
+            zeta = friction / (2 * omega)
+            omega_d = omega * math.sqrt(1 - zeta * zeta) if zeta < 1 else 0.0
         
         if zeta < 1:  # Underdamped
-            omega_d = omega * math.sqrt(1 - zeta * zeta)
-            return 1 - math.exp(-zeta * omega * t) * math.cos(omega_d * t)
+            return 1 - _exp(-zeta * omega * t) * _cos(omega_d * t)
         else:  # Overdamped
-            return 1 - math.exp(-omega * t)
+            return 1 - _exp(-omega * t)
+    
+    @staticmethod
+    def pulse(t: float) -> float:
+        """Out-and-back 0 -> 1 -> 0 curve: cubic ease-in up, cubic ease-out down."""
+        u = 2 * t if t < 0.5 else 2 * (1 - t)
+        return u * u * u
     
     @classmethod
     def get_easing_function(cls, easing_type: EasingType) -> Callable[[float], float]:
         """Get easing function by type."""
-        mapping = {
-            EasingType.LINEAR: cls.linear,
-            EasingType.EASE_IN: cls.ease_in_cubic,
-            EasingType.EASE_OUT: cls.ease_out_cubic,
-            EasingType.EASE_IN_OUT: cls.ease_in_out_cubic,
-            EasingType.ELASTIC: cls.elastic_out,
-            EasingType.BOUNCE: cls.bounce_out,
-            EasingType.SPRING: cls.spring
-        }
-        return mapping.get(easing_type, cls.linear)
+        if isinstance(easing_type, EasingType):
+            return _EASING_TABLE[easing_type]
+        return cls.linear
+
+# Easing functions indexed by EasingType value, built once at import time
+_EASING_TABLE: Tuple[Callable[[float], float], ...] = (
+    EasingFunctions.linear,             # LINEAR
+    EasingFunctions.ease_in_cubic,      # EASE_IN
+    EasingFunctions.ease_out_cubic,     # EASE_OUT
+    EasingFunctions.ease_in_out_cubic,  # EASE_IN_OUT
+    EasingFunctions.elastic_out,        # ELASTIC
+    EasingFunctions.bounce_out,         # BOUNCE
+    EasingFunctions.spring,             # SPRING
+    EasingFunctions.pulse               # PULSE
+)
+
+# Easing curves sampled ahead of time; Animation.update interpolates between samples
+_EASING_LUT_STEPS = 63
+_EASING_LUT: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(fn(i / _EASING_LUT_STEPS) for i in range(_EASING_LUT_STEPS + 1))
+    for fn in _EASING_TABLE
+)
 
 class Animation:
     """Represents a single animation with timing and easing."""
+    __slots__ = (
+        "start_value", "end_value", "duration", "easing", "on_update", "on_complete",
+        "start_time", "is_running", "is_completed", "current_value",
+        "easing_function", "_easing_lut", "_inv_duration", "_interp"
+    )
     
     def __init__(self, start_value: Any, end_value: Any, duration: float,
                  easing: EasingType = EasingType.EASE_OUT,
@@ -143,14 +198,29 @@ class Animation:
         self.current_value = start_value
         
         self.easing_function = EasingFunctions.get_easing_function(easing)
+        self._easing_lut = _EASING_LUT[easing] if isinstance(easing, EasingType) else None
+        self._inv_duration = 1.0 / duration if duration > 0 else float('inf')
+        self._interp = self._make_interpolator(start_value, end_value)
     
     def start(self):
         """Start the animation."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        
+        if self.duration < _MIN_FRAME_TIME:
+            # Too short to render a frame; jump straight to the end of the curve
+            self.current_value = self._interp(self.easing_function(1.0))
+            self.is_running = False
+            self.is_completed = True
+            if self.on_update:
+                self.on_update(self.current_value)
+            if self.on_complete:
+                self.on_complete()
+            return
+        
         self.is_running = True
         self.is_completed = False
     
-    def update(self) -> bool:
+    def update(self, now: Optional[float] = None) -> bool:
         """Update animation and return True if still running."""
         if not self.is_running or self.is_completed:
             return False
@@ -158,14 +228,27 @@ class Animation:
         if self.start_time is None:
             self.start()
         
-        elapsed = time.time() - self.start_time
-        progress = min(elapsed / self.duration, 1.0)
+        if now is None:
+            now = time.monotonic()
+        progress = (now - self.start_time) * self._inv_duration
+        if not progress < 1.0:  # Also catches NaN from zero-length animations
+            progress = 1.0
         
-        # Apply easing
-        eased_progress = self.easing_function(progress)
+        # Apply easing from the precomputed curve samples
+        lut = self._easing_lut
+        if lut is None:
+            eased_progress = self.easing_function(progress)
+        else:
+            x = progress * _EASING_LUT_STEPS
+            i = int(x)
+            if i >= _EASING_LUT_STEPS:
+                eased_progress = lut[_EASING_LUT_STEPS]
+            else:
+                a = lut[i]
+                eased_progress = a + (lut[i + 1] - a) * (x - i)
         
         # Interpolate value
-        self.current_value = self._interpolate(self.start_value, self.end_value, eased_progress)
+        self.current_value = self._interp(eased_progress)
         
         # Call update callback
         if self.on_update:
@@ -192,42 +275,69 @@ class Animation:
         self.is_completed = False
         self.current_value = self.start_value
     
-    def _interpolate(self, start: Any, end: Any, progress: float) -> Any:
-        """Interpolate between start and end values."""
+    @staticmethod
+    def _make_interpolator(start: Any, end: Any) -> Callable[[float], Any]:
+        """Build an interpolator specialized for the start/end value types."""
         if isinstance(start, (int, float)) and isinstance(end, (int, float)):
-            return start + (end - start) * progress
+            delta = end - start
+            return lambda progress: start + delta * progress
         elif isinstance(start, tuple) and isinstance(end, tuple) and len(start) == len(end):
             # Tuple interpolation (e.g., colors, coordinates)
-            return tuple(s + (e - s) * progress for s, e in zip(start, end))
+            pairs = tuple((s, e - s) for s, e in zip(start, end))
+            return lambda progress: tuple(s + d * progress for s, d in pairs)
         elif isinstance(start, dict) and isinstance(end, dict):
-            # Dictionary interpolation
-            result = {}
-            for key in start.keys():
-                if key in end:
-                    result[key] = self._interpolate(start[key], end[key], progress)
-                else:
-                    result[key] = start[key]
-            return result
+            # Dictionary interpolation; keys missing from end keep their start value
+            entries = [
+                (key, Animation._make_interpolator(value, end[key]) if key in end else None, value)
+                for key, value in start.items()
+            ]
+            return lambda progress: {
+                key: interp(progress) if interp is not None else value
+                for key, interp, value in entries
+            }
         else:
             # For non-numeric types, return end value when progress > 0.5
-            return end if progress > 0.5 else start
+            return lambda progress: end if progress > 0.5 else start
+
+class _AnimState:
+    """Hot per-frame state for a running animation in the manager's active list."""
+    __slots__ = ("name", "animation", "target", "index")
+    
+    def __init__(self, name: str, animation: Animation, target: Optional[_PropertyTarget],
+                 index: int):
+        self.name = name
+        self.animation = animation
+        self.target = target
+        self.index = index
 
 class AnimationManager:
-    """Manages multiple animations with threading support."""
+    """Manages multiple animations driven from the Tk event loop."""
     
     def __init__(self, parent_widget=None):
         """Initialize animation manager."""
         self.parent_widget = parent_widget
         self.animations: Dict[str, Animation] = {}
-        self.animation_thread: Optional[threading.Thread] = None
+        self._property_targets: Dict[str, _PropertyTarget] = {}
+        
+        # Running animations, kept in a flat list for the per-frame loop
+        self._active: List[_AnimState] = []
+        self._states: Dict[str, _AnimState] = {}
+        
         self.is_running = False
         self.frame_rate = 60  # FPS
         self.frame_time = 1.0 / self.frame_rate
+        self._frame_ms = int(self.frame_time * 1000)
+        self._after_id = None
     
     def add_animation(self, name: str, animation: Animation) -> str:
         """Add animation to manager."""
+        state = self._states.get(name)
+        if state is not None:
+            # Replacing an animation under the same name cancels the old one
+            state.animation.stop()
+            self._remove_active(state)
+        
         self.animations[name] = animation
-        self._ensure_animation_loop()
         return name
     
     def create_animation(self, name: str, start_value: Any, end_value: Any,
@@ -241,91 +351,177 @@ class AnimationManager:
     def start_animation(self, name: str):
         """Start specific animation."""
         if name in self.animations:
-            self.animations[name].start()
+            animation = self.animations[name]
+            target = self._property_targets.get(name)
+            animation.start()
+            
+            if animation.is_completed:
+                # Finished immediately; apply the final value without a frame
+                self._unregister(name, animation)
+                widget = target[0]() if target is not None else None
+                if widget is not None:
+                    property_name = target[1]
+                    self._flush_property_updates({
+                        (id(widget), property_name): (widget, property_name,
+                                                      animation.current_value)
+                    })
+                return
+            
+            if name not in self._states:
+                state = _AnimState(name, animation, target, len(self._active))
+                self._active.append(state)
+                self._states[name] = state
+            
             self._ensure_animation_loop()
     
     def stop_animation(self, name: str):
         """Stop specific animation."""
         if name in self.animations:
             self.animations[name].stop()
+        state = self._states.get(name)
+        if state is not None:
+            self._remove_active(state)
     
     def remove_animation(self, name: str):
         """Remove animation from manager."""
-        if name in self.animations:
-            self.animations[name].stop()
-            del self.animations[name]
+        self.stop_animation(name)
+        self.animations.pop(name, None)
+        self._property_targets.pop(name, None)
     
     def stop_all(self):
         """Stop all animations."""
         for animation in self.animations.values():
             animation.stop()
+        for state in self._active:
+            state.index = -1
+        self._active.clear()
+        self._states.clear()
         self.is_running = False
+        
+        if self._after_id is not None and self.parent_widget:
+            try:
+                self.parent_widget.after_cancel(self._after_id)
+            except Exception:
+                pass  # Parent might be destroyed
+        self._after_id = None
     
     def clear_all(self):
         """Clear all animations."""
         self.stop_all()
         self.animations.clear()
+        self._property_targets.clear()
+    
+    def _remove_active(self, state: _AnimState):
+        """Remove a state from the active list in O(1) by swapping with the last entry."""
+        index = state.index
+        if index < 0:
+            return
+        
+        last = self._active.pop()
+        if last is not state:
+            self._active[index] = last
+            last.index = index
+        state.index = -1
+        
+        if self._states.get(state.name) is state:
+            del self._states[state.name]
+    
+    def _unregister(self, name: str, animation: Animation):
+        """Forget a finished animation unless its name was reused meanwhile."""
+        if self.animations.get(name) is animation:
+            del self.animations[name]
+            self._property_targets.pop(name, None)
     
     def _ensure_animation_loop(self):
-        """Ensure animation loop is running."""
-        if not self.is_running and self.animations:
+        """Ensure animation loop is scheduled on the parent widget."""
+        if not self.is_running and self._active and self.parent_widget:
             self.is_running = True
-            self.animation_thread = threading.Thread(target=self._animation_loop, daemon=True)
-            self.animation_thread.start()
+            self._after_id = self.parent_widget.after(self._frame_ms, self._tick)
     
-    def _animation_loop(self):
-        """Main animation loop."""
-        while self.is_running and self.animations:
-            start_time = time.time()
+    def _tick(self):
+        """Advance all animations by one frame on the Tk main thread."""
+        self._after_id = None
+        if not self.is_running:
+            return
+        
+        # Update all animations, staging property writes so each
+        # (widget, property) pair is written at most once per frame
+        pending: Dict[Tuple[int, str], Tuple[Any, str, Any]] = {}
+        active = self._active
+        now = time.monotonic()
+        i = 0
+        while i < len(active):
+            state = active[i]
+            animation = state.animation
+            target = state.target
             
-            # Update all animations
-            completed_animations = []
-            for name, animation in self.animations.items():
-                if animation.is_running and not animation.update():
-                    completed_animations.append(name)
+            if target is not None:
+                widget = target[0]()
+                if widget is None:
+                    # Widget was destroyed and collected; drop its animation
+                    animation.stop()
+                    self._unregister(state.name, animation)
+                    self._remove_active(state)
+                    continue
             
-            # Remove completed animations
-            for name in completed_animations:
-                if name in self.animations:
-                    del self.animations[name]
+            still_running = animation.is_running and animation.update(now)
             
-            # Check if any animations are still running
-            if not any(anim.is_running for anim in self.animations.values()):
-                self.is_running = False
-                break
+            if target is not None and (still_running or animation.is_completed):
+                property_name = target[1]
+                pending[(id(widget), property_name)] = (widget, property_name,
+                                                        animation.current_value)
             
-            # Sleep for frame timing
-            elapsed = time.time() - start_time
-            sleep_time = max(0, self.frame_time - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if still_running:
+                i += 1
+                continue
+            
+            # Completed or stopped; the slot at i is refilled by the swap
+            if animation.is_completed:
+                self._unregister(state.name, animation)
+            self._remove_active(state)
+        
+        self._flush_property_updates(pending)
+        
+        # Check if any animations are still running
+        if not active:
+            self.is_running = False
+            return
+        
+        self._after_id = self.parent_widget.after(self._frame_ms, self._tick)
+    
+    def _flush_property_updates(self, pending: Dict[Tuple[int, str], Tuple[Any, str, Any]]):
+        """Apply the latest staged value for each animated widget property."""
+        for widget, property_name, value in pending.values():
+            try:
+                setattr(widget, property_name, value)
+            except Exception:
+                pass  # Widget might be destroyed
     
     def animate_property(self, widget, property_name: str, target_value: Any,
                         duration: float = 0.3, easing: EasingType = EasingType.EASE_OUT,
                         on_complete: Optional[Callable[[], None]] = None) -> str:
         """Animate a widget property."""
-        # Get current value
-        try:
-            current_value = getattr(widget, property_name)
-        except AttributeError:
+        # Get current value; properties like 'scale' only exist once animated
+        current_value = getattr(widget, property_name, _NO_ATTR)
+        if current_value is _NO_ATTR:
             current_value = 0
         
-        # Create update function
-        def update_property(value):
-            try:
-                if self.parent_widget:
-                    self.parent_widget.after(0, lambda: setattr(widget, property_name, value))
-                else:
-                    setattr(widget, property_name, value)
-            except Exception:
-                pass  # Widget might be destroyed
-        
-        # Create animation
+        return self._animate_target(widget, property_name, current_value, target_value,
+                                    duration, easing, on_complete)
+    
+    def _animate_target(self, widget, property_name: str, start_value: Any, target_value: Any,
+                        duration: float, easing: EasingType,
+                        on_complete: Optional[Callable[[], None]] = None) -> str:
+        """Create and start an animation that writes to a widget property."""
+        # Register the target so the tick loop can coalesce writes
         animation_name = f"{id(widget)}_{property_name}"
-        return self.create_animation(
-            animation_name, current_value, target_value, duration, easing,
-            update_property, on_complete
+        self.create_animation(
+            animation_name, start_value, target_value, duration, easing,
+            None, on_complete
         )
+        self._property_targets[animation_name] = (_widget_ref(widget), property_name)
+        self.start_animation(animation_name)
+        return animation_name
     
     def fade_in(self, widget, duration: float = 0.3) -> str:
         """Fade in animation."""
@@ -372,58 +568,73 @@ class AnimationManager:
     
     def pulse_animation(self, widget, intensity: float = 1.2, duration: float = 0.5) -> str:
         """Pulse animation that scales up and down."""
-        def on_scale_up_complete():
-            self.animate_property(widget, 'scale', 1.0, duration / 2, EasingType.EASE_OUT)
-        
-        return self.animate_property(widget, 'scale', intensity, duration / 2, 
-                                   EasingType.EASE_IN, on_scale_up_complete)
+        # A single out-and-back animation from rest scale up to intensity and back
+        return self._animate_target(widget, 'scale', 1.0, intensity, duration, EasingType.PULSE)
     
     def shake_animation(self, widget, intensity: int = 5, duration: float = 0.5) -> str:
         """Shake animation for error feedback."""
         original_x = getattr(widget, 'x', 0)
         shake_count = int(duration * 10)  # 10 shakes per second
         
-        def shake_step(step: int):
-            if step >= shake_count:
+        if not hasattr(widget, 'place'):
+            return f"shake_{id(widget)}"
+        
+        # Precompute decaying, alternating offsets for every step
+        offsets = iter(tuple(
+            intensity * (1 - step / shake_count) * (1 if step % 2 == 0 else -1)
+            for step in range(shake_count)
+        ))
+        
+        def shake_step():
+            offset = next(offsets, None)
+            if offset is None:
                 # Return to original position
-                if hasattr(widget, 'place'):
-                    widget.place(x=original_x)
+                widget.place(x=original_x)
                 return
             
-            # Calculate shake offset
-            progress = step / shake_count
-            decay = 1 - progress  # Decay over time
-            offset = intensity * decay * (1 if step % 2 == 0 else -1)
-            
-            # Apply shake
-            if hasattr(widget, 'place'):
-                widget.place(x=original_x + offset)
+            widget.place(x=original_x + offset)
             
             # Schedule next shake
             if self.parent_widget:
-                self.parent_widget.after(int(1000 / 10), lambda: shake_step(step + 1))
+                self.parent_widget.after(100, shake_step)
         
-        shake_step(0)
+        shake_step()
         return f"shake_{id(widget)}"
     
     def color_transition(self, widget, target_color: str, duration: float = 0.3,
                         property_name: str = "fg_color") -> str:
         """Animate color transition."""
-        # This would need to be implemented with color interpolation
-        # For now, just set the target color
         animation_name = f"{id(widget)}_color"
         
-        def set_color():
+        try:
+            current_color = widget.cget(property_name)
+        except Exception:
+            current_color = None
+        
+        if not (_is_hex_color(current_color) and _is_hex_color(target_color)):
+            # Named or per-mode colors can't be interpolated; just set the target
+            def set_color():
+                try:
+                    if hasattr(widget, 'configure'):
+                        widget.configure(**{property_name: target_color})
+                except Exception:
+                    pass
+            
+            if self.parent_widget:
+                self.parent_widget.after(int(duration * 1000), set_color)
+            return animation_name
+        
+        lerp = PrecomputedColorLerp(current_color, target_color)
+        
+        def update_color(progress: float):
             try:
-                if hasattr(widget, 'configure'):
-                    widget.configure(**{property_name: target_color})
+                widget.configure(**{property_name: lerp(progress)})
             except Exception:
-                pass
-        
-        # Use a simple delay for color transition
-        if self.parent_widget:
-            self.parent_widget.after(int(duration * 1000), set_color)
+                pass  # Widget might be destroyed
         
+        self.create_animation(animation_name, 0.0, 1.0, duration,
+                              EasingType.EASE_OUT, update_color)
+        self.start_animation(animation_name)
         return animation_name
     
     def chain_animations(self, animations: List[tuple]) -> str:
@@ -482,21 +693,41 @@ def create_click_animation(widget, animation_manager: AnimationManager,
         widget.bind('<Button-1>', on_button_press)
         widget.bind('<ButtonRelease-1>', on_button_release)
 
+def _widget_ref(widget) -> Callable[[], Any]:
+    """Weakly reference a widget, falling back to a strong reference if unsupported."""
+    try:
+        return weakref.ref(widget)
+    except TypeError:
+        return lambda: widget
+
+_HEX_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}")
+
+def _is_hex_color(color: Any) -> bool:
+    """Check whether a value is a #rrggbb color string."""
+    return isinstance(color, str) and _HEX_COLOR_RE.fullmatch(color) is not None
+
+class PrecomputedColorLerp:
+    """Interpolates between two hex colors with channels parsed once up front."""
+    
+    def __init__(self, start_color: str, end_color: str):
+        """Parse both colors and precompute per-channel deltas."""
+        start = int(start_color.lstrip('#'), 16)
+        end = int(end_color.lstrip('#'), 16)
+        
+        self._r = (start >> 16) & 0xFF
+        self._g = (start >> 8) & 0xFF
+        self._b = start & 0xFF
+        self._dr = ((end >> 16) & 0xFF) - self._r
+        self._dg = ((end >> 8) & 0xFF) - self._g
+        self._db = (end & 0xFF) - self._b
+    
+    def __call__(self, progress: float) -> str:
+        """Return the hex color at the given progress."""
+        r = int(self._r + self._dr * progress)
+        g = int(self._g + self._dg * progress)
+        b = int(self._b + self._db * progress)
+        return f"#{r:02x}{g:02x}{b:02x}"
+
 def interpolate_color(start_color: str, end_color: str, progress: float) -> str:
     """Interpolate between two hex colors."""
-    def hex_to_rgb(hex_color: str) -> tuple:
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
-    def rgb_to_hex(rgb: tuple) -> str:
-        return f"#{int(rgb[0]):02x}{int(rgb[1]):02x}{int(rgb[2]):02x}"
-    
-    start_rgb = hex_to_rgb(start_color)
-    end_rgb = hex_to_rgb(end_color)
-    
-    interpolated_rgb = tuple(
-        start + (end - start) * progress
-        for start, end in zip(start_rgb, end_rgb)
-    )
-    
-    return rgb_to_hex(interpolated_rgb)
+    return PrecomputedColorLerp(start_color, end_color)(progress)
@@ -3,19 +3,230 @@ File management utilities for workflow saving, loading, and operations.
 Provides secure file operations with validation and backup support.
 """
 
+import io
 import os
+import re
 import json
+import fnmatch
+import functools
 import shutil
+import sys
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, TypeVar, Union
 from datetime import datetime
 import zipfile
 import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; workflow headers fall back to a full parse
+    ijson = None
 
 from workflow.serializer import WorkflowSerializer
 
+# Read size for checksumming without hashlib.file_digest
+_CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# Number of per-file workflow summaries kept by FileManager
+_SUMMARY_CACHE_SIZE = 128
+
+# Upper bound on threads used to overlap per-file reads
+_MAX_IO_WORKERS = 32
+
+# Linux FICLONE ioctl: share the source's extents (reflink) on Btrfs/XFS
+_FICLONE = 0x40049409
+
+# Characters not allowed in filenames on some platforms
+_SANITIZE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+# Checksum journal kept in the workspace; compacted once it holds this many records
+_CHECKSUM_JOURNAL_NAME = ".checksum_cache.jsonl"
+_CHECKSUM_JOURNAL_MAX_ENTRIES = 1000
+
+# Top-level collections counted (not built) when reading a workflow header
+_HEADER_COUNTED_KEYS = {"nodes": "node_count", "connections": "connection_count"}
+_HEADER_ITEM_PREFIXES = {f"{key}.item": count for key, count in _HEADER_COUNTED_KEYS.items()}
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+def _fsync_fd(fd: int):
+    """Flush a file descriptor to stable storage (F_FULLFSYNC on macOS)."""
+    if fcntl is not None and hasattr(fcntl, "F_FULLFSYNC"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            return
+        except OSError:
+            pass  # Filesystem doesn't support it; fall back to fsync
+    os.fsync(fd)
+
+def _write_all(fd: int, data: bytes):
+    """Write all of data to a file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _fsync_directory(dir_path: Path):
+    """Flush a directory entry so a completed rename survives a crash."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Directories can't be opened for fsync on this platform
+    dir_fd = os.open(str(dir_path), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+def _copy_in_kernel(in_fd: int, out_fd: int) -> bool:
+    """Clone or copy file contents without a userspace buffer; False if unsupported."""
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(out_fd, _FICLONE, in_fd)
+            return True
+        except OSError:
+            pass  # Different filesystem or no reflink support
+    
+    if not hasattr(os, "copy_file_range"):
+        return False
+    
+    remaining = os.fstat(in_fd).st_size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(in_fd, out_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    except OSError:
+        return False
+    return remaining <= 0
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]):
+    """Copy a file with its metadata, reflinking on filesystems that support it."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copied = _copy_in_kernel(fsrc.fileno(), fdst.fileno())
+    except OSError:
+        copied = False
+    
+    if copied:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _dump_json_line(data: Any) -> bytes:
+    """Serialize data to a compact single-line UTF-8 JSON record."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def _read_header_only(file_path: str) -> Dict[str, Any]:
+    """Read a workflow file's metadata, version, and node/connection counts.
+    
+    With ijson installed the file is streamed and only the metadata object is
+    built; nodes and connections are counted from parser events.
+    """
+    if ijson is None:
+        return _read_header_full(file_path)
+    
+    header = {"metadata": {}, "node_count": 0, "connection_count": 0, "version": "unknown"}
+    builder = None
+    with open(file_path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "metadata" and event == "end_map":
+                    header["metadata"] = builder.value
+                    builder = None
+            elif prefix in _HEADER_COUNTED_KEYS:
+                if event == "map_key":
+                    header[_HEADER_COUNTED_KEYS[prefix]] += 1
+            elif prefix in _HEADER_ITEM_PREFIXES:
+                if event in ("start_map", "start_array", "string", "number", "boolean", "null"):
+                    header[_HEADER_ITEM_PREFIXES[prefix]] += 1
+            elif prefix == "metadata":
+                if event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+            elif prefix == "version":
+                header["version"] = value
+            elif prefix == "" and event not in ("start_map", "end_map", "map_key"):
+                # Not an object at the root; let the full parse report it
+                return _read_header_full(file_path)
+    
+    return header
+
+def _read_header_full(file_path: str) -> Dict[str, Any]:
+    """Read a workflow header by parsing the whole file."""
+    with open(file_path, "rb") as f:
+        workflow_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    
+    if not isinstance(workflow_data, dict):
+        raise ValueError("Workflow file root is not a JSON object")
+    
+    metadata = workflow_data.get("metadata", {})
+    if not isinstance(metadata, dict):
+        raise ValueError("Workflow metadata is not a JSON object")
+    
+    return {
+        "metadata": metadata,
+        "node_count": len(workflow_data.get("nodes", {})),
+        "connection_count": len(workflow_data.get("connections", {})),
+        "version": workflow_data.get("version", "unknown")
+    }
+
+def _map_parallel(func: Callable[[_T], _R], items: List[_T]) -> List[_R]:
+    """Map func over items, overlapping the calls on a thread pool when worthwhile."""
+    if len(items) < 2:
+        return [func(item) for item in items]
+    
+    with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
+
+def _scan_files(root: Path, recursive: bool = True,
+                name_pattern: Optional["re.Pattern[str]"] = None
+                ) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """Yield (entry, stat) for files under root using a single stat per file."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if name_pattern is None or name_pattern.match(entry.name):
+                                yield entry, entry.stat()
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue  # Entry vanished or is unreadable
+        except OSError:
+            continue  # Directory vanished or is unreadable
+
+@functools.lru_cache(maxsize=32)
+def _compile_name_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile glob patterns into one regex matching any of them."""
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
 class FileManagerError(Exception):
     """Custom exception for file manager errors."""
     pass
@@ -26,13 +237,15 @@ class BackupManager:
     def __init__(self, backup_dir: Optional[str] = None, max_backups: int = 10):
         """Initialize backup manager."""
         self.max_backups = max_backups
+        self._backup_pattern_cache: Dict[str, "re.Pattern[str]"] = {}
         
         if backup_dir:
             self.backup_dir = Path(backup_dir)
         else:
             self.backup_dir = Path.home() / ".workflow_builder" / "backups"
         
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # The backup directory is created by the first backup
+        self._backup_dir_ready = False
     
     def create_backup(self, file_path: str, backup_suffix: str = "") -> str:
         """Create backup of a file."""
@@ -40,60 +253,77 @@ class BackupManager:
         if not source_path.exists():
             raise FileManagerError(f"Source file not found: {file_path}")
         
+        if not self._backup_dir_ready:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            self._backup_dir_ready = True
+        
         # Generate backup filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{source_path.stem}_{timestamp}{backup_suffix}{source_path.suffix}"
         backup_path = self.backup_dir / backup_name
         
         # Copy file to backup location
-        shutil.copy2(source_path, backup_path)
+        _fast_copy(source_path, backup_path)
         
         # Clean up old backups
         self._cleanup_old_backups(source_path.stem)
         
         return str(backup_path)
     
+    def _backup_pattern(self, base_name: Optional[str]) -> Optional["re.Pattern[str]"]:
+        """Get the compiled name pattern for a file's backups (None matches all)."""
+        if not base_name:
+            return None
+        
+        pattern = self._backup_pattern_cache.get(base_name)
+        if pattern is None:
+            pattern = re.compile(fnmatch.translate(f"{base_name}_*"))
+            self._backup_pattern_cache[base_name] = pattern
+        return pattern
+    
+    def _scan_backups(self, base_name: Optional[str]) -> List[Tuple[os.DirEntry, os.stat_result]]:
+        """Scan the backup directory once, newest backups first."""
+        backup_files = list(_scan_files(self.backup_dir, recursive=False,
+                                        name_pattern=self._backup_pattern(base_name)))
+        backup_files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        return backup_files
+    
     def _cleanup_old_backups(self, base_name: str):
         """Remove old backup files beyond max_backups limit."""
-        backup_pattern = f"{base_name}_*"
-        backup_files = list(self.backup_dir.glob(backup_pattern))
-        
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        
         # Remove excess backups
-        for backup_file in backup_files[self.max_backups:]:
+        for entry, _ in self._scan_backups(base_name)[self.max_backups:]:
             try:
-                backup_file.unlink()
+                os.unlink(entry.path)
             except OSError:
                 pass  # Ignore errors when deleting old backups
     
     def list_backups(self, base_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List available backups."""
-        if base_name:
-            pattern = f"{base_name}_*"
-        else:
-            pattern = "*"
-        
-        backup_files = list(self.backup_dir.glob(pattern))
+        """List available backups, newest first (mtime_epoch is in epoch seconds)."""
         backups = []
         
-        for backup_file in backup_files:
-            stat = backup_file.stat()
+        for entry, stat in self._scan_backups(base_name):
             backups.append({
-                "name": backup_file.name,
-                "path": str(backup_file),
+                "name": entry.name,
+                "path": entry.path,
                 "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_mtime),
-                "base_name": backup_file.stem.split("_")[0]
+                "mtime_epoch": stat.st_mtime,
+                "base_name": Path(entry.name).stem.split("_")[0]
             })
         
-        return sorted(backups, key=lambda x: x["created"], reverse=True)
+        return backups
+    
+    def count_backups(self) -> int:
+        """Count backup files without stat'ing them."""
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                return sum(1 for entry in entries if entry.is_file())
+        except OSError:
+            return 0  # No backups made yet
     
     def restore_backup(self, backup_path: str, target_path: str) -> bool:
         """Restore a backup to target location."""
         try:
-            shutil.copy2(backup_path, target_path)
+            _fast_copy(backup_path, target_path)
             return True
         except Exception as e:
             raise FileManagerError(f"Failed to restore backup: {str(e)}")
@@ -102,37 +332,71 @@ class FileManager:
     """Comprehensive file manager for workflow operations."""
     
     def __init__(self, workspace_dir: Optional[str] = None):
-        """Initialize file manager."""
+        """Initialize file manager.
+        
+        The serializer and backup manager are created on first use, and the
+        workspace directory by the first write.
+        """
         self.logger = logging.getLogger(__name__)
-        self.serializer = WorkflowSerializer()
         
         # Set up workspace directory
         if workspace_dir:
             self.workspace_dir = Path(workspace_dir)
         else:
             self.workspace_dir = Path.home() / ".workflow_builder" / "workspace"
-        
-        self.workspace_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize backup manager
-        self.backup_manager = BackupManager()
+        self._workspace_ready = False
         
         # Current file tracking
         self.current_file_path: Optional[str] = None
         self.file_history: List[str] = []
         
-        # File watching
-        self._file_checksums: Dict[str, str] = {}
+        # File watching: path -> (size, mtime_ns, checksum), persisted across runs
+        # in the workspace's journal, which is read on the first checksum lookup
+        self._file_checksums: Dict[str, Tuple[int, int, str]] = {}
+        self._checksums_loaded = False
+        self._checksum_journal_entries = 0
+        
+        # Workflow summaries: path -> ((path, mtime_ns, size), summary)
+        self._summary_cache: OrderedDict = OrderedDict()
+        self._summary_lock = threading.Lock()
+    
+    @functools.cached_property
+    def serializer(self) -> WorkflowSerializer:
+        """Workflow serializer, created on first use."""
+        return WorkflowSerializer()
+    
+    @functools.cached_property
+    def backup_manager(self) -> BackupManager:
+        """Backup manager, created on first use."""
+        return BackupManager()
     
     def set_workspace(self, workspace_path: str):
         """Set the workspace directory."""
         self.workspace_dir = Path(workspace_path)
-        self.workspace_dir.mkdir(parents=True, exist_ok=True)
+        self._workspace_ready = False
+        # Merge the new workspace's checksum journal on the next lookup
+        self._checksums_loaded = False
         self.logger.info(f"Workspace set to: {workspace_path}")
     
+    @property
+    def _checksum_journal_path(self) -> Path:
+        """The checksum journal of the current workspace."""
+        return self.workspace_dir / _CHECKSUM_JOURNAL_NAME
+    
+    def _ensure_workspace(self):
+        """Create the workspace directory before the first write into it."""
+        if not self._workspace_ready:
+            self.workspace_dir.mkdir(parents=True, exist_ok=True)
+            self._workspace_ready = True
+    
     def save_workflow(self, workflow_data: Dict[str, Any], file_path: str,
-                     create_backup: bool = True) -> bool:
-        """Save workflow to file with optional backup."""
+                     create_backup: bool = True, durable: bool = True) -> bool:
+        """Save workflow to file with optional backup.
+        
+        The file is written to a temporary file, fsynced and renamed into
+        place. With durable=False the parent directory is not fsynced after
+        the rename, trading crash safety of the new name for speed.
+        """
         try:
             file_path = Path(file_path)
             
@@ -144,7 +408,8 @@ class FileManager:
                 except Exception as e:
                     self.logger.warning(f"Failed to create backup: {str(e)}")
             
-            # Ensure directory exists
+            # Ensure directories exist
+            self._ensure_workspace()
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Prepare metadata
@@ -154,20 +419,29 @@ class FileManager:
                 "file_path": str(file_path)
             }
             
-            # Use temporary file for atomic write
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.tmp', 
-                                           dir=file_path.parent, delete=False) as tmp_file:
-                temp_path = tmp_file.name
-                
-                # Serialize and save
-                self.serializer.save_to_file(workflow_data, temp_path, metadata)
-            
-            # Atomic move to final location
-            shutil.move(temp_path, file_path)
+            # Serialize once; the checksum comes from the same bytes
+            blob = self.serializer.dump_bytes(workflow_data, metadata)
+            checksum = hashlib.sha256(blob).hexdigest()
             
-            # Update tracking
+            # Use temporary file for atomic write, flushing its contents
+            # before the rename so the target is never empty
+            temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=file_path.parent)
+            try:
+                _write_all(temp_fd, blob)
+                _fsync_fd(temp_fd)
+            finally:
+                os.close(temp_fd)
+            
+            # Atomic rename to final location (same directory, same filesystem)
+            os.replace(temp_path, file_path)
+            if durable:
+                _fsync_directory(file_path.parent)
+            
+            # Update tracking; a cleanly validated save needs no revalidation on reload
+            st = os.stat(file_path)
+            self.serializer.mark_trusted(str(file_path), st)
             self.current_file_path = str(file_path)
-            self._update_file_checksum(str(file_path))
+            self._record_file_checksum(str(file_path), st, checksum)
             self._add_to_history(str(file_path))
             
             self.logger.info(f"Workflow saved: {file_path}")
@@ -221,6 +495,7 @@ class FileManager:
         """Export workflow in various formats."""
         try:
             export_path = Path(export_path)
+            self._ensure_workspace()
             export_path.parent.mkdir(parents=True, exist_ok=True)
             
             if export_format == "json":
@@ -253,14 +528,22 @@ class FileManager:
     
     def _export_as_zip(self, workflow_data: Dict[str, Any], zip_path: Path):
         """Export workflow as ZIP archive with assets."""
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Add main workflow file
-            workflow_json = self.serializer.export_to_format(workflow_data, "json")
-            zip_file.writestr("workflow.json", workflow_json)
+        # workflow.json uses the archive default (fast DEFLATE); the small
+        # entries are stored, where compressor setup would cost more than it saves
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            # Add main workflow file; orjson encodes to bytes in one C call,
+            # otherwise stream json.dump straight into the archive
+            serialized = self.serializer.serialize_workflow(workflow_data)
+            if orjson is not None:
+                zip_file.writestr("workflow.json", _dump_json_bytes(serialized))
+            else:
+                with zip_file.open("workflow.json", "w", force_zip64=True) as entry:
+                    with io.TextIOWrapper(entry, encoding="utf-8") as text_entry:
+                        json.dump(serialized, text_entry, indent=2)
             
             # Add summary
             summary = self.serializer.export_to_format(workflow_data, "summary")
-            zip_file.writestr("README.txt", summary)
+            zip_file.writestr("README.txt", summary, compress_type=zipfile.ZIP_STORED)
             
             # Add metadata
             metadata = {
@@ -268,7 +551,8 @@ class FileManager:
                 "format_version": "1.0",
                 "exported_by": "Workflow Builder"
             }
-            zip_file.writestr("metadata.json", json.dumps(metadata, indent=2))
+            zip_file.writestr("metadata.json", _dump_json_bytes(metadata),
+                              compress_type=zipfile.ZIP_STORED)
     
     def import_workflow(self, import_path: str) -> Dict[str, Any]:
         """Import workflow from various formats."""
@@ -298,37 +582,46 @@ class FileManager:
             if not workflow_files:
                 raise FileManagerError("No workflow file found in ZIP archive")
             
-            # Read workflow data
-            workflow_content = zip_file.read(workflow_files[0])
-            workflow_data = json.loads(workflow_content.decode('utf-8'))
+            # Read workflow data; orjson parses raw bytes, json decodes while decompressing
+            if orjson is not None:
+                workflow_data = orjson.loads(zip_file.read(workflow_files[0]))
+            else:
+                with zip_file.open(workflow_files[0]) as entry:
+                    workflow_data = json.load(io.TextIOWrapper(entry, encoding="utf-8"))
             
             return self.serializer.deserialize_workflow(workflow_data)
     
-    def list_workspace_files(self, pattern: str = "*.wf.json") -> List[Dict[str, Any]]:
-        """List workflow files in workspace."""
+    def list_workspace_files(self, pattern: Union[str, List[str]] = "*.wf.json") -> List[Dict[str, Any]]:
+        """List workflow files in workspace matching any of the given patterns.
+        
+        Files are sorted newest first; mtime_epoch is in epoch seconds.
+        """
         files = []
+        patterns = (pattern,) if isinstance(pattern, str) else tuple(pattern)
+        name_pattern = _compile_name_patterns(patterns)
+        entries = list(_scan_files(self.workspace_dir, recursive=False,
+                                   name_pattern=name_pattern))
         
-        for file_path in self.workspace_dir.glob(pattern):
-            if file_path.is_file():
-                stat = file_path.stat()
-                
-                # Try to get workflow metadata
-                metadata = {"name": file_path.stem}
-                try:
-                    workflow_data = self.serializer.load_from_file(str(file_path))
-                    metadata.update(workflow_data.get("metadata", {}))
-                except:
-                    pass  # Use default metadata if file can't be loaded
-                
-                files.append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime),
-                    "metadata": metadata
-                })
+        # Read workflow headers concurrently; uncached files each need a header read
+        summaries = _map_parallel(lambda item: self._workflow_summary(item[0].path, item[1]),
+                                  entries)
+        
+        for (entry, stat), summary in zip(entries, summaries):
+            file_path = Path(entry.path)
+            
+            # Try to get workflow metadata; defaults stay if the file can't be loaded
+            metadata = {"name": file_path.stem}
+            metadata.update(summary.get("metadata", {}))
+            
+            files.append({
+                "name": file_path.name,
+                "path": str(file_path),
+                "size": stat.st_size,
+                "mtime_epoch": stat.st_mtime,
+                "metadata": metadata
+            })
         
-        return sorted(files, key=lambda x: x["modified"], reverse=True)
+        return sorted(files, key=lambda x: x["mtime_epoch"], reverse=True)
     
     def create_new_workflow(self, name: str = "New Workflow") -> Dict[str, Any]:
         """Create a new empty workflow."""
@@ -409,76 +702,208 @@ class FileManager:
         if not self.current_file_path:
             return False
         
-        current_checksum = self._calculate_file_checksum(self.current_file_path)
-        stored_checksum = self._file_checksums.get(self.current_file_path)
+        self._ensure_checksums_loaded()
+        stored = self._file_checksums.get(self.current_file_path)
+        if stored is None:
+            return True
+        stored_size, stored_mtime_ns, stored_checksum = stored
+        
+        try:
+            st = os.stat(self.current_file_path)
+        except OSError:
+            return stored_checksum != ""
+        
+        # Unchanged stat means unchanged content; a size change always means changed
+        if st.st_size == stored_size and st.st_mtime_ns == stored_mtime_ns:
+            return False
+        if st.st_size != stored_size:
+            return True
         
-        return current_checksum != stored_checksum
+        return self._calculate_file_checksum(self.current_file_path) != stored_checksum
     
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
-        """Get detailed information about a workflow file."""
+    def get_file_info(self, file_path: str, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Get detailed information about a workflow file.
+        
+        Callers that already hold a stat result for the file can pass it as st.
+        """
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
-                raise FileManagerError(f"File not found: {file_path}")
-            
-            stat = file_path.stat()
+            if st is None:
+                try:
+                    st = os.stat(file_path)
+                except FileNotFoundError:
+                    raise FileManagerError(f"File not found: {file_path}")
             
             info = {
                 "path": str(file_path),
                 "name": file_path.name,
-                "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime),
-                "modified": datetime.fromtimestamp(stat.st_mtime),
-                "checksum": self._calculate_file_checksum(str(file_path))
+                "size": st.st_size,
+                "created": datetime.fromtimestamp(st.st_ctime),
+                "modified": datetime.fromtimestamp(st.st_mtime),
+                "mtime_epoch": st.st_mtime,
+                "checksum": self._calculate_file_checksum(str(file_path), st)
             }
             
-            # Try to get workflow metadata
-            try:
-                workflow_data = self.serializer.load_from_file(str(file_path))
-                info["metadata"] = workflow_data.get("metadata", {})
-                info["node_count"] = len(workflow_data.get("nodes", {}))
-                info["connection_count"] = len(workflow_data.get("connections", {}))
-                info["version"] = workflow_data.get("version", "unknown")
-            except Exception as e:
-                info["error"] = f"Failed to read workflow data: {str(e)}"
+            # Workflow metadata and counts (or the read error)
+            summary = self._workflow_summary(str(file_path), st)
+            info.update(summary)
+            if "metadata" in summary:
+                info["metadata"] = dict(summary["metadata"])
             
             return info
             
         except Exception as e:
             raise FileManagerError(f"Failed to get file info: {str(e)}")
     
-    def _sanitize_filename(self, filename: str) -> str:
-        """Sanitize filename for cross-platform compatibility."""
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+    def _workflow_summary(self, file_path: str, st: os.stat_result) -> Dict[str, Any]:
+        """Read workflow metadata and counts, cached until the file's stat changes."""
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        with self._summary_lock:
+            cached = self._summary_cache.get(file_path)
+            if cached is not None and cached[0] == key:
+                self._summary_cache.move_to_end(file_path)
+                return cached[1]
         
-        # Trim whitespace and dots
-        filename = filename.strip('. ')
+        try:
+            summary = _read_header_only(file_path)
+        except Exception as e:
+            summary = {"error": f"Failed to read workflow data: {str(e)}"}
         
-        # Ensure not empty
-        if not filename:
-            filename = "untitled"
+        with self._summary_lock:
+            self._summary_cache[file_path] = (key, summary)
+            self._summary_cache.move_to_end(file_path)
+            if len(self._summary_cache) > _SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
         
-        return filename
+        return summary
+    
+    def _sanitize_filename(self, filename: str) -> str:
+        """Sanitize filename for cross-platform compatibility."""
+        # Replace invalid characters in one pass, trim whitespace and dots,
+        # and ensure not empty
+        return filename.translate(_SANITIZE_TABLE).strip('. ') or "untitled"
     
-    def _calculate_file_checksum(self, file_path: str) -> str:
-        """Calculate MD5 checksum of file."""
+    def _calculate_file_checksum(self, file_path: str,
+                                 st: Optional[os.stat_result] = None) -> str:
+        """Calculate SHA-256 checksum of file.
+        
+        If st matches the size and mtime recorded for the file, the recorded
+        checksum is returned without reading the file.
+        """
+        if st is not None:
+            self._ensure_checksums_loaded()
+            stored = self._file_checksums.get(file_path)
+            if stored is not None and stored[0] == st.st_size and stored[1] == st.st_mtime_ns:
+                return stored[2]
+        
         try:
-            hash_md5 = hashlib.md5()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+                
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(_CHECKSUM_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                return digest.hexdigest()
         except Exception:
             return ""
     
     def _update_file_checksum(self, file_path: str):
         """Update stored checksum for file."""
-        checksum = self._calculate_file_checksum(file_path)
-        self._file_checksums[file_path] = checksum
+        self._ensure_checksums_loaded()
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            self._file_checksums[file_path] = (-1, -1, "")
+            return
+        
+        self._record_file_checksum(file_path, st, self._calculate_file_checksum(file_path))
+    
+    def _record_file_checksum(self, file_path: str, st: os.stat_result, checksum: str):
+        """Store a known checksum for file as of the given stat."""
+        self._ensure_checksums_loaded()
+        # Re-inserted so compaction keeps the most recently recorded files
+        self._file_checksums.pop(file_path, None)
+        self._file_checksums[file_path] = (st.st_size, st.st_mtime_ns, checksum)
+        if checksum:
+            self._append_checksum_entry(file_path, st.st_size, st.st_mtime_ns, checksum)
+    
+    def _ensure_checksums_loaded(self):
+        """Load the workspace's checksum journal before the first lookup."""
+        if not self._checksums_loaded:
+            self._checksums_loaded = True
+            self._load_checksum_cache()
+    
+    def _load_checksum_cache(self):
+        """Load checksums recorded by earlier runs, dropping stale entries."""
+        self._checksum_journal_entries = 0
+        try:
+            with open(self._checksum_journal_path, "rb") as f:
+                lines = f.readlines()
+        except OSError:
+            return  # No journal yet
+        
+        # Later lines supersede earlier ones for the same path
+        entries: Dict[str, Tuple[int, int, str]] = {}
+        for line in lines:
+            try:
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+                entries[record["path"]] = (record["size"], record["mtime_ns"], record["sha256"])
+            except (ValueError, KeyError, TypeError):
+                continue  # Torn or malformed line
+        
+        for file_path, (size, mtime_ns, checksum) in entries.items():
+            # Entries recorded in this session are newer than the journal's
+            if file_path in self._file_checksums:
+                continue
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            if st.st_size == size and st.st_mtime_ns == mtime_ns:
+                self._file_checksums[file_path] = (size, mtime_ns, checksum)
+        
+        self._checksum_journal_entries = len(lines)
+        if len(lines) > _CHECKSUM_JOURNAL_MAX_ENTRIES:
+            self._compact_checksum_journal()
+    
+    def _compact_checksum_journal(self):
+        """Rewrite the checksum journal with the most recent valid entries."""
+        # Keep at most half the cap so compactions stay infrequent
+        records = [(file_path, entry) for file_path, entry in self._file_checksums.items() if entry[2]]
+        records = records[-(_CHECKSUM_JOURNAL_MAX_ENTRIES // 2):]
+        try:
+            journal_dir = self._checksum_journal_path.parent
+            fd, temp_path = tempfile.mkstemp(dir=journal_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for file_path, (size, mtime_ns, checksum) in records:
+                        f.write(_dump_json_line({"path": file_path, "size": size,
+                                                 "mtime_ns": mtime_ns, "sha256": checksum}))
+                os.replace(temp_path, self._checksum_journal_path)
+                self._checksum_journal_entries = len(records)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            self.logger.debug(f"Failed to compact checksum journal: {str(e)}")
+    
+    def _append_checksum_entry(self, file_path: str, size: int, mtime_ns: int, checksum: str):
+        """Append a checksum record to the journal (not fsynced; it's only a cache)."""
+        record = _dump_json_line({"path": file_path, "size": size,
+                                  "mtime_ns": mtime_ns, "sha256": checksum})
+        try:
+            self._ensure_workspace()
+            with open(self._checksum_journal_path, "ab") as f:
+                f.write(record)
+        except OSError as e:
+            self.logger.debug(f"Failed to record checksum: {str(e)}")
+            return
+        
+        self._checksum_journal_entries += 1
+        if self._checksum_journal_entries > _CHECKSUM_JOURNAL_MAX_ENTRIES:
+            self._compact_checksum_journal()
     
     def _add_to_history(self, file_path: str):
         """Add file to recent files history."""
@@ -492,76 +917,79 @@ class FileManager:
     
     def get_recent_files(self) -> List[Dict[str, Any]]:
         """Get list of recently opened files."""
-        recent_files = []
-        
-        for file_path in self.file_history:
-            if Path(file_path).exists():
-                try:
-                    info = self.get_file_info(file_path)
-                    recent_files.append(info)
-                except:
-                    pass  # Skip files that can't be read
+        def read_info(file_path: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_file_info(file_path)
+            except Exception:
+                return None  # Skip files that are missing or can't be read
         
-        return recent_files
+        infos = _map_parallel(read_info, list(self.file_history))
+        return [info for info in infos if info is not None]
     
     def cleanup_workspace(self, older_than_days: int = 30):
         """Clean up old files in workspace."""
         cutoff_time = datetime.now().timestamp() - (older_than_days * 24 * 60 * 60)
-        cleaned_count = 0
         
-        for file_path in self.workspace_dir.rglob("*"):
-            if file_path.is_file():
-                if file_path.stat().st_mtime < cutoff_time:
-                    try:
-                        # Create backup before cleanup
-                        self.backup_manager.create_backup(str(file_path), "_cleanup")
-                        file_path.unlink()
-                        cleaned_count += 1
-                    except Exception as e:
-                        self.logger.warning(f"Failed to clean up {file_path}: {str(e)}")
+        # List everything first so deletions can't disturb the directory walk;
+        # the checksum journal is bookkeeping, not a workspace file
+        journal_path = str(self._checksum_journal_path)
+        old_files = [entry.path for entry, stat in _scan_files(self.workspace_dir)
+                     if stat.st_mtime < cutoff_time and entry.path != journal_path]
+        
+        # Serial on purpose: each backup prunes "<stem>_*" backups, which also
+        # match other stems with that prefix (a_* covers a_b_*), so parallel
+        # groups could delete each other's fresh cleanup backups
+        backup_manager = self.backup_manager
+        cleaned_count = 0
+        for file_path in old_files:
+            try:
+                # Create backup before cleanup
+                backup_manager.create_backup(file_path, "_cleanup")
+                os.unlink(file_path)
+                cleaned_count += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to clean up {file_path}: {str(e)}")
         
         self.logger.info(f"Cleaned up {cleaned_count} old files")
         return cleaned_count
     
     def get_workspace_stats(self) -> Dict[str, Any]:
-        """Get workspace statistics."""
-        stats = {
-            "total_files": 0,
-            "total_size": 0,
-            "workflow_files": 0,
-            "backup_files": 0,
-            "oldest_file": None,
-            "newest_file": None
+        """Get workspace statistics (file times are epoch seconds)."""
+        backup_dir = self.backup_manager.backup_dir
+        backups_in_workspace = backup_dir.is_relative_to(self.workspace_dir)
+        backup_dir_str = str(backup_dir)
+        
+        total_files = total_size = workflow_files = backup_files = 0
+        oldest_time, oldest_path = float('inf'), None
+        newest_time, newest_path = 0, None
+        
+        # One walk accumulates everything; backups inside the workspace are counted on the way
+        journal_path = str(self._checksum_journal_path)
+        for entry, stat in _scan_files(self.workspace_dir):
+            path = entry.path
+            if path == journal_path:
+                continue
+            mtime = stat.st_mtime
+            total_files += 1
+            total_size += stat.st_size
+            workflow_files += entry.name.endswith('.json')
+            if backups_in_workspace:
+                backup_files += os.path.dirname(path) == backup_dir_str
+            
+            if mtime < oldest_time:
+                oldest_time, oldest_path = mtime, path
+            if mtime > newest_time:
+                newest_time, newest_path = mtime, path
+        
+        # Backups elsewhere only need counting, not stat'ing
+        if not backups_in_workspace:
+            backup_files = self.backup_manager.count_backups()
+        
+        return {
+            "total_files": total_files,
+            "total_size": total_size,
+            "workflow_files": workflow_files,
+            "backup_files": backup_files,
+            "oldest_file": {"path": oldest_path, "mtime_epoch": oldest_time} if oldest_path else None,
+            "newest_file": {"path": newest_path, "mtime_epoch": newest_time} if newest_path else None
         }
-        
-        oldest_time = float('inf')
-        newest_time = 0
-        
-        for file_path in self.workspace_dir.rglob("*"):
-            if file_path.is_file():
-                stat = file_path.stat()
-                stats["total_files"] += 1
-                stats["total_size"] += stat.st_size
-                
-                if file_path.suffix == '.json':
-                    stats["workflow_files"] += 1
-                
-                if stat.st_mtime < oldest_time:
-                    oldest_time = stat.st_mtime
-                    stats["oldest_file"] = {
-                        "path": str(file_path),
-                        "modified": datetime.fromtimestamp(stat.st_mtime)
-                    }
-                
-                if stat.st_mtime > newest_time:
-                    newest_time = stat.st_mtime
-                    stats["newest_file"] = {
-                        "path": str(file_path),
-                        "modified": datetime.fromtimestamp(stat.st_mtime)
-                    }
-        
-        # Get backup stats
-        backup_files = self.backup_manager.list_backups()
-        stats["backup_files"] = len(backup_files)
-        
-        return stats
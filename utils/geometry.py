@@ -4,10 +4,21 @@ Provides classes and functions for working with points, rectangles, and shapes.
 """
 
 import math
-from typing import List, Tuple, Optional, Union
+import functools
+from array import array
+from typing import Iterable, List, Tuple, Optional, Union
 from dataclasses import dataclass
 
-@dataclass
+# Point count from which convex_hull prefilters interior points
+_HULL_PREFILTER_MIN_POINTS = 32
+
+# Module-level aliases skip the math attribute lookup in hot methods
+_cos = math.cos
+_sin = math.sin
+_hypot = math.hypot
+_atan2 = math.atan2
+
+@dataclass(slots=True)
 class Point:
     """Represents a 2D point with x and y coordinates."""
     x: float
@@ -31,11 +42,17 @@ class Point:
     
     def distance_to(self, other: 'Point') -> float:
         """Calculate distance to another point."""
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return _hypot(self.x - other.x, self.y - other.y)
+    
+    def distance_sq_to(self, other: 'Point') -> float:
+        """Calculate squared distance to another point (for comparisons)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
     
     def magnitude(self) -> float:
         """Calculate magnitude (distance from origin)."""
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        return _hypot(self.x, self.y)
     
     def normalize(self) -> 'Point':
         """Normalize the point to unit length."""
@@ -50,25 +67,19 @@ class Point:
     
     def angle_to(self, other: 'Point') -> float:
         """Calculate angle to another point in radians."""
-        return math.atan2(other.y - self.y, other.x - self.x)
+        return _atan2(other.y - self.y, other.x - self.x)
     
     def rotate(self, angle: float, origin: Optional['Point'] = None) -> 'Point':
         """Rotate point around origin by angle (in radians)."""
-        if origin is None:
-            origin = Point(0, 0)
-        
-        # Translate to origin
-        translated = self - origin
-        
-        # Rotate
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
+        ox, oy = (0.0, 0.0) if origin is None else (origin.x, origin.y)
         
-        rotated_x = translated.x * cos_a - translated.y * sin_a
-        rotated_y = translated.x * sin_a + translated.y * cos_a
+        # Rotate the offset from origin and translate back in one step
+        dx = self.x - ox
+        dy = self.y - oy
+        cos_a = _cos(angle)
+        sin_a = _sin(angle)
         
-        # Translate back
-        return Point(rotated_x, rotated_y) + origin
+        return Point(dx * cos_a - dy * sin_a + ox, dx * sin_a + dy * cos_a + oy)
     
     def to_tuple(self) -> Tuple[float, float]:
         """Convert to tuple."""
@@ -82,8 +93,67 @@ class Point:
     def from_tuple(cls, coords: Tuple[float, float]) -> 'Point':
         """Create point from tuple."""
         return cls(coords[0], coords[1])
+    
+    @staticmethod
+    def to_array(points: Iterable['Point']) -> 'PointArray':
+        """Pack points into a PointArray for bulk operations."""
+        return PointArray.from_points(points)
 
-@dataclass
+class PointArray:
+    """Many 2D points stored as two contiguous coordinate columns.
+    
+    Bulk operations loop over plain floats instead of Point objects, and
+    min/max reductions over a column run entirely in C.
+    """
+    
+    __slots__ = ('xs', 'ys')
+    
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = ()):
+        """Initialize from x and y coordinate sequences of equal length."""
+        self.xs = array('d', xs)
+        self.ys = array('d', ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+    
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> 'PointArray':
+        """Create from Point objects."""
+        points = points if isinstance(points, (list, tuple)) else list(points)
+        return cls([p.x for p in points], [p.y for p in points])
+    
+    def __len__(self) -> int:
+        """Number of points."""
+        return len(self.xs)
+    
+    def __getitem__(self, index: int) -> Point:
+        """Get a single point."""
+        return Point(self.xs[index], self.ys[index])
+    
+    def to_points(self) -> List[Point]:
+        """Unpack into Point objects."""
+        return [Point(x, y) for x, y in zip(self.xs, self.ys)]
+    
+    def distance_to_batch(self, other: Point) -> List[float]:
+        """Distance from every point to another point."""
+        ox, oy = other.x, other.y
+        return [_hypot(x - ox, y - oy) for x, y in zip(self.xs, self.ys)]
+    
+    def rotate_batch(self, angle: float, origin: Optional[Point] = None) -> 'PointArray':
+        """Rotate every point around origin by angle (in radians)."""
+        ox, oy = (0.0, 0.0) if origin is None else (origin.x, origin.y)
+        return PointArray(*rotate_points(self.xs, self.ys, angle, ox, oy))
+    
+    def transform_batch(self, transform: 'Transform') -> 'PointArray':
+        """Apply a transform to every point."""
+        m00, m01, m02, m10, m11, m12 = transform.affine
+        
+        xs, ys = self.xs, self.ys
+        return PointArray(
+            [m00 * x + m01 * y + m02 for x, y in zip(xs, ys)],
+            [m10 * x + m11 * y + m12 for x, y in zip(xs, ys)]
+        )
+
+@dataclass(slots=True)
 class Rectangle:
     """Represents a rectangle with position and dimensions."""
     x: float
@@ -114,7 +184,7 @@ class Rectangle:
     @property
     def center(self) -> Point:
         """Center point of rectangle."""
-        return Point(self.x + self.width / 2, self.y + self.height / 2)
+        return Point(self.x + self.width * 0.5, self.y + self.height * 0.5)
     
     @property
     def top_left(self) -> Point:
@@ -138,15 +208,18 @@ class Rectangle:
     
     def contains_point(self, point: Point) -> bool:
         """Check if rectangle contains a point."""
-        return (self.left <= point.x <= self.right and
-                self.top <= point.y <= self.bottom)
+        # Edges are read from the fields directly; the properties cost a call each
+        x, y = self.x, self.y
+        return (x <= point.x <= x + self.width and
+                y <= point.y <= y + self.height)
     
     def intersects(self, other: 'Rectangle') -> bool:
         """Check if this rectangle intersects with another."""
-        return (self.left < other.right and
-                self.right > other.left and
-                self.top < other.bottom and
-                self.bottom > other.top)
+        x, y, other_x, other_y = self.x, self.y, other.x, other.y
+        return (x < other_x + other.width and
+                x + self.width > other_x and
+                y < other_y + other.height and
+                y + self.height > other_y)
     
     def intersection(self, other: 'Rectangle') -> Optional['Rectangle']:
         """Get intersection rectangle with another rectangle."""
@@ -171,26 +244,26 @@ class Rectangle:
     
     def expand(self, amount: float) -> 'Rectangle':
         """Expand rectangle by amount in all directions."""
+        twice = 2 * amount
         return Rectangle(
             self.x - amount,
             self.y - amount,
-            self.width + 2 * amount,
-            self.height + 2 * amount
+            self.width + twice,
+            self.height + twice
         )
     
     def scale(self, factor: float, origin: Optional[Point] = None) -> 'Rectangle':
         """Scale rectangle by factor around origin."""
+        x, y, width, height = self.x, self.y, self.width, self.height
         if origin is None:
-            origin = self.center
-        
-        new_width = self.width * factor
-        new_height = self.height * factor
-        
-        # Calculate new position to maintain origin
-        new_x = origin.x - (origin.x - self.x) * factor
-        new_y = origin.y - (origin.y - self.y) * factor
+            # Center, without building a Point
+            ox, oy = x + width * 0.5, y + height * 0.5
+        else:
+            ox, oy = origin.x, origin.y
         
-        return Rectangle(new_x, new_y, new_width, new_height)
+        # New position keeps origin fixed
+        return Rectangle(ox + (x - ox) * factor, oy + (y - oy) * factor,
+                         width * factor, height * factor)
     
     def area(self) -> float:
         """Calculate area of rectangle."""
@@ -212,116 +285,155 @@ class Rectangle:
     @classmethod
     def from_center(cls, center: Point, width: float, height: float) -> 'Rectangle':
         """Create rectangle from center point and dimensions."""
-        x = center.x - width / 2
-        y = center.y - height / 2
+        x = center.x - width * 0.5
+        y = center.y - height * 0.5
         return cls(x, y, width, height)
 
+class RectangleArray:
+    """Many rectangles stored as edge columns for broad-phase queries.
+    
+    Right and bottom edges are computed once, so each test is four float
+    comparisons per rectangle.
+    """
+    
+    __slots__ = ('lefts', 'tops', 'rights', 'bottoms')
+    
+    def __init__(self, rectangles: Iterable[Rectangle] = ()):
+        """Initialize from Rectangle objects."""
+        rectangles = rectangles if isinstance(rectangles, (list, tuple)) else list(rectangles)
+        self.lefts = array('d', [r.x for r in rectangles])
+        self.tops = array('d', [r.y for r in rectangles])
+        self.rights = array('d', [r.x + r.width for r in rectangles])
+        self.bottoms = array('d', [r.y + r.height for r in rectangles])
+    
+    def __len__(self) -> int:
+        """Number of rectangles."""
+        return len(self.lefts)
+    
+    def __getitem__(self, index: int) -> Rectangle:
+        """Get a single rectangle."""
+        left, top = self.lefts[index], self.tops[index]
+        return Rectangle(left, top, self.rights[index] - left, self.bottoms[index] - top)
+    
+    def intersects_mask(self, query: Rectangle) -> List[bool]:
+        """For each rectangle, whether it intersects query (as Rectangle.intersects)."""
+        q_left, q_top = query.x, query.y
+        q_right, q_bottom = q_left + query.width, q_top + query.height
+        return [left < q_right and right > q_left and top < q_bottom and bottom > q_top
+                for left, top, right, bottom
+                in zip(self.lefts, self.tops, self.rights, self.bottoms)]
+    
+    def contains_point_mask(self, x: float, y: float) -> List[bool]:
+        """For each rectangle, whether it contains (x, y) (as Rectangle.contains_point)."""
+        return [left <= x <= right and top <= y <= bottom
+                for left, top, right, bottom
+                in zip(self.lefts, self.tops, self.rights, self.bottoms)]
+
 class Transform:
-    """2D transformation matrix for scaling, rotation, and translation."""
+    """2D affine transformation for scaling, rotation, and translation.
+    
+    Stored as the top two rows (a, b, tx), (c, d, ty) of the homogeneous
+    matrix; the bottom row is always [0, 0, 1].
+    """
+    
+    __slots__ = ('affine',)
     
     def __init__(self, matrix: Optional[List[List[float]]] = None):
-        """Initialize transform with optional matrix."""
+        """Initialize transform with optional 3x3 (or 2x3) matrix."""
         if matrix is None:
             # Identity matrix
-            self.matrix = [
-                [1.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0],
-                [0.0, 0.0, 1.0]
-            ]
+            self.affine = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
         else:
-            self.matrix = matrix
+            (a, b, tx), (c, d, ty) = matrix[0], matrix[1]
+            self.affine = (a, b, tx, c, d, ty)
+    
+    @classmethod
+    def _from_affine(cls, a: float, b: float, tx: float,
+                     c: float, d: float, ty: float) -> 'Transform':
+        """Create transform directly from affine coefficients."""
+        transform = cls.__new__(cls)
+        transform.affine = (a, b, tx, c, d, ty)
+        return transform
+    
+    @property
+    def matrix(self) -> List[List[float]]:
+        """Full 3x3 homogeneous matrix."""
+        a, b, tx, c, d, ty = self.affine
+        return [
+            [a, b, tx],
+            [c, d, ty],
+            [0.0, 0.0, 1.0]
+        ]
     
     def translate(self, dx: float, dy: float) -> 'Transform':
         """Apply translation."""
-        translation = Transform([
-            [1.0, 0.0, dx],
-            [0.0, 1.0, dy],
-            [0.0, 0.0, 1.0]
-        ])
-        return self.multiply(translation)
+        return self.multiply(Transform._from_affine(1.0, 0.0, dx, 0.0, 1.0, dy))
     
     def scale(self, sx: float, sy: Optional[float] = None) -> 'Transform':
         """Apply scaling."""
         if sy is None:
             sy = sx
         
-        scaling = Transform([
-            [sx, 0.0, 0.0],
-            [0.0, sy, 0.0],
-            [0.0, 0.0, 1.0]
-        ])
-        return self.multiply(scaling)
+        return self.multiply(Transform._from_affine(sx, 0.0, 0.0, 0.0, sy, 0.0))
     
     def rotate(self, angle: float) -> 'Transform':
         """Apply rotation (angle in radians)."""
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
+        cos_a = _cos(angle)
+        sin_a = _sin(angle)
         
-        rotation = Transform([
-            [cos_a, -sin_a, 0.0],
-            [sin_a, cos_a, 0.0],
-            [0.0, 0.0, 1.0]
-        ])
-        return self.multiply(rotation)
+        return self.multiply(Transform._from_affine(cos_a, -sin_a, 0.0, sin_a, cos_a, 0.0))
     
     def multiply(self, other: 'Transform') -> 'Transform':
         """Multiply with another transform."""
-        result = [[0.0] * 3 for _ in range(3)]
+        a1, b1, tx1, c1, d1, ty1 = self.affine
+        a2, b2, tx2, c2, d2, ty2 = other.affine
         
-        for i in range(3):
-            for j in range(3):
-                for k in range(3):
-                    result[i][j] += self.matrix[i][k] * other.matrix[k][j]
-        
-        return Transform(result)
+        # Linear parts compose as 2x2 products; translation is other's
+        # translation mapped through self, plus self's
+        return Transform._from_affine(
+            a1 * a2 + b1 * c2, a1 * b2 + b1 * d2, a1 * tx2 + b1 * ty2 + tx1,
+            c1 * a2 + d1 * c2, c1 * b2 + d1 * d2, c1 * tx2 + d1 * ty2 + ty1
+        )
     
     def transform_point(self, point: Point) -> Point:
         """Transform a point using this transformation."""
-        x = self.matrix[0][0] * point.x + self.matrix[0][1] * point.y + self.matrix[0][2]
-        y = self.matrix[1][0] * point.x + self.matrix[1][1] * point.y + self.matrix[1][2]
-        return Point(x, y)
+        a, b, tx, c, d, ty = self.affine
+        x, y = point.x, point.y
+        return Point(a * x + b * y + tx, c * x + d * y + ty)
+    
+    def transform_points(self, points: Union[List[Point], PointArray]) -> PointArray:
+        """Transform many points at once."""
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+        return points.transform_batch(self)
     
     def inverse(self) -> 'Transform':
         """Calculate inverse transformation."""
-        # Calculate determinant
-        det = (self.matrix[0][0] * (self.matrix[1][1] * self.matrix[2][2] - 
-                                   self.matrix[1][2] * self.matrix[2][1]) -
-               self.matrix[0][1] * (self.matrix[1][0] * self.matrix[2][2] - 
-                                   self.matrix[1][2] * self.matrix[2][0]) +
-               self.matrix[0][2] * (self.matrix[1][0] * self.matrix[2][1] - 
-                                   self.matrix[1][1] * self.matrix[2][0]))
+        a, b, tx, c, d, ty = self.affine
         
+        det = a * d - b * c
         if abs(det) < 1e-10:
             raise ValueError("Transform is not invertible")
         
-        # Calculate inverse matrix
-        inv = [[0.0] * 3 for _ in range(3)]
-        
-        inv[0][0] = (self.matrix[1][1] * self.matrix[2][2] - 
-                     self.matrix[1][2] * self.matrix[2][1]) / det
-        inv[0][1] = (self.matrix[0][2] * self.matrix[2][1] - 
-                     self.matrix[0][1] * self.matrix[2][2]) / det
-        inv[0][2] = (self.matrix[0][1] * self.matrix[1][2] - 
-                     self.matrix[0][2] * self.matrix[1][1]) / det
-        
-        inv[1][0] = (self.matrix[1][2] * self.matrix[2][0] - 
-                     self.matrix[1][0] * self.matrix[2][2]) / det
-        inv[1][1] = (self.matrix[0][0] * self.matrix[2][2] - 
-                     self.matrix[0][2] * self.matrix[2][0]) / det
-        inv[1][2] = (self.matrix[0][2] * self.matrix[1][0] - 
-                     self.matrix[0][0] * self.matrix[1][2]) / det
-        
-        inv[2][0] = (self.matrix[1][0] * self.matrix[2][1] - 
-                     self.matrix[1][1] * self.matrix[2][0]) / det
-        inv[2][1] = (self.matrix[0][1] * self.matrix[2][0] - 
-                     self.matrix[0][0] * self.matrix[2][1]) / det
-        inv[2][2] = (self.matrix[0][0] * self.matrix[1][1] - 
-                     self.matrix[0][1] * self.matrix[1][0]) / det
-        
-        return Transform(inv)
+        # Inverse 2x2 linear part, then undo the translation through it
+        inv_det = 1.0 / det
+        return Transform._from_affine(
+            d * inv_det, -b * inv_det, (b * ty - d * tx) * inv_det,
+            -c * inv_det, a * inv_det, (c * tx - a * ty) * inv_det
+        )
 
 # Utility functions
 
+def rotate_points(xs: Iterable[float], ys: Iterable[float], angle: float,
+                  ox: float = 0.0, oy: float = 0.0) -> Tuple[List[float], List[float]]:
+    """Rotate coordinate columns around (ox, oy) by angle (in radians)."""
+    cos_a = _cos(angle)
+    sin_a = _sin(angle)
+    
+    offsets = [(x - ox, y - oy) for x, y in zip(xs, ys)]
+    return ([dx * cos_a - dy * sin_a + ox for dx, dy in offsets],
+            [dx * sin_a + dy * cos_a + oy for dx, dy in offsets])
+
 def distance_between_points(p1: Point, p2: Point) -> float:
     """Calculate distance between two points."""
     return p1.distance_to(p2)
@@ -332,13 +444,24 @@ def midpoint(p1: Point, p2: Point) -> Point:
 
 def angle_between_points(p1: Point, p2: Point) -> float:
     """Calculate angle from p1 to p2 in radians."""
-    return math.atan2(p2.y - p1.y, p2.x - p1.x)
+    return _atan2(p2.y - p1.y, p2.x - p1.x)
+
+@functools.lru_cache(maxsize=64)
+def _cos_sin(angle: float) -> Tuple[float, float]:
+    """Cosine and sine of angle, cached for fixed handle/anchor angles."""
+    return _cos(angle), _sin(angle)
 
 def point_on_circle(center: Point, radius: float, angle: float) -> Point:
     """Get point on circle at given angle."""
-    x = center.x + radius * math.cos(angle)
-    y = center.y + radius * math.sin(angle)
-    return Point(x, y)
+    cos_a, sin_a = _cos_sin(angle)
+    return Point(center.x + radius * cos_a, center.y + radius * sin_a)
+
+def points_on_circle(center: Point, radius: float, angles: Iterable[float]) -> PointArray:
+    """Get points on circle at many angles (regular polygons, pie slices, etc.)."""
+    cx, cy = center.x, center.y
+    trig = [_cos_sin(angle) for angle in angles]
+    return PointArray([cx + radius * cos_a for cos_a, _ in trig],
+                      [cy + radius * sin_a for _, sin_a in trig])
 
 def point_on_line(start: Point, end: Point, t: float) -> Point:
     """Get point on line segment at parameter t (0 to 1)."""
@@ -349,78 +472,202 @@ def point_on_line(start: Point, end: Point, t: float) -> Point:
 
 def closest_point_on_line(point: Point, line_start: Point, line_end: Point) -> Point:
     """Find closest point on line segment to given point."""
-    line_vec = line_end - line_start
-    point_vec = point - line_start
+    sx, sy = line_start.x, line_start.y
+    line_dx = line_end.x - sx
+    line_dy = line_end.y - sy
     
-    line_length_sq = line_vec.dot(line_vec)
+    line_length_sq = line_dx * line_dx + line_dy * line_dy
     if line_length_sq == 0:
         return line_start
     
-    t = max(0, min(1, point_vec.dot(line_vec) / line_length_sq))
-    return point_on_line(line_start, line_end, t)
+    # Projection parameter from dot products only, clamped to the segment
+    t = ((point.x - sx) * line_dx + (point.y - sy) * line_dy) / line_length_sq
+    t = 0.0 if t < 0 else 1.0 if t > 1 else t
+    return Point(sx + t * line_dx, sy + t * line_dy)
 
-def point_in_polygon(point: Point, polygon: List[Point]) -> bool:
+def point_in_polygon(point: Point, polygon: Union[List[Point], PointArray]) -> bool:
     """Check if point is inside polygon using ray casting algorithm."""
     if len(polygon) < 3:
         return False
     
-    x, y = point.x, point.y
-    inside = False
+    if not isinstance(polygon, PointArray):
+        polygon = PointArray.from_points(polygon)
+    
+    return _pip_core(point.x, point.y, polygon.xs, polygon.ys)
+
+def points_in_polygon_batch(points: Union[List[Point], PointArray],
+                            polygon: Union[List[Point], PointArray]) -> List[bool]:
+    """Check many points against one polygon, converting the polygon once."""
+    return PolygonPIP(polygon).contains_batch(points)
+
+class PolygonPIP:
+    """Polygon prepared for repeated point-in-polygon queries.
+    
+    Per-edge slopes are computed once, so each query is a multiply-add per
+    edge with no division. Horizontal edges can never cross the test ray and
+    are dropped, and points outside the bounding box are rejected before
+    any edge is visited.
+    """
     
-    j = len(polygon) - 1
-    for i in range(len(polygon)):
-        xi, yi = polygon[i].x, polygon[i].y
-        xj, yj = polygon[j].x, polygon[j].y
+    __slots__ = ('_edges', '_bounds')
+    
+    def __init__(self, polygon: Union[List[Point], PointArray]):
+        """Prepare the polygon's edges."""
+        if not isinstance(polygon, PointArray):
+            polygon = PointArray.from_points(polygon)
+        
+        # (yi, yj, xi, dx/dy) for each edge from vertex j (previous) to i
+        self._edges: List[Tuple[float, float, float, float]] = []
+        self._bounds = (0.0, 0.0, -1.0, -1.0)  # Empty box rejects everything
+        if len(polygon) < 3:
+            return
+        
+        xs, ys = polygon.xs, polygon.ys
+        self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        xj, yj = xs[-1], ys[-1]
+        for xi, yi in zip(xs, ys):
+            if yi != yj:
+                self._edges.append((yi, yj, xi, (xj - xi) / (yj - yi)))
+            xj, yj = xi, yi
+    
+    def contains(self, x: float, y: float) -> bool:
+        """Check if (x, y) is inside the polygon using ray casting."""
+        min_x, min_y, max_x, max_y = self._bounds
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return False
         
+        inside = False
+        for yi, yj, xi, slope in self._edges:
+            if ((yi > y) != (yj > y)) and (x < slope * (y - yi) + xi):
+                inside = not inside
+        return inside
+    
+    def contains_point(self, point: Point) -> bool:
+        """Check if point is inside the polygon."""
+        return self.contains(point.x, point.y)
+    
+    def contains_batch(self, points: Union[List[Point], PointArray]) -> List[bool]:
+        """Check many points against the polygon."""
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+        
+        contains = self.contains
+        return [contains(x, y) for x, y in zip(points.xs, points.ys)]
+
+def _pip_core(x: float, y: float, xs: array, ys: array) -> bool:
+    """Ray casting test over polygon coordinate columns."""
+    inside = False
+    
+    # Walk edges (previous vertex -> current vertex), starting from the closing edge
+    xj, yj = xs[-1], ys[-1]
+    for xi, yi in zip(xs, ys):
         if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
             inside = not inside
-        j = i
+        xj, yj = xi, yi
     
     return inside
 
-def convex_hull(points: List[Point]) -> List[Point]:
+def _hull_candidates(xs: array, ys: array) -> List[int]:
+    """Indices of points not strictly inside the extreme-point quadrilateral.
+    
+    Akl-Toussaint heuristic: the leftmost, bottom-most, rightmost and topmost
+    points are hull vertices, so anything strictly inside the quadrilateral
+    they form cannot be.
+    """
+    indices = range(len(xs))
+    extremes = (min(indices, key=xs.__getitem__), min(indices, key=ys.__getitem__),
+                max(indices, key=xs.__getitem__), max(indices, key=ys.__getitem__))
+    
+    # Distinct corners in boundary order
+    quad: List[Tuple[float, float]] = []
+    for i in extremes:
+        corner = (xs[i], ys[i])
+        if not quad or corner != quad[-1]:
+            quad.append(corner)
+    if len(quad) > 1 and quad[0] == quad[-1]:
+        quad.pop()
+    if len(quad) < 3:
+        return list(indices)
+    
+    # Edges as (x0, y0, dx, dy), oriented so inside points have positive cross products
+    edges = [(x0, y0, x1 - x0, y1 - y0)
+             for (x0, y0), (x1, y1) in zip(quad, quad[1:] + quad[:1])]
+    area2 = sum(x0 * dy - y0 * dx for x0, y0, dx, dy in edges)
+    if area2 == 0:
+        return list(indices)
+    if area2 < 0:
+        edges = [(x0, y0, -dx, -dy) for x0, y0, dx, dy in edges]
+    if len(edges) == 3:
+        edges.append(edges[0])  # Triangle: repeat an edge so the test below stays unrolled
+    
+    (x0, y0, dx0, dy0), (x1, y1, dx1, dy1), (x2, y2, dx2, dy2), (x3, y3, dx3, dy3) = edges
+    return [i for i, x, y in zip(indices, xs, ys)
+            if not (dx0 * (y - y0) > dy0 * (x - x0) and dx1 * (y - y1) > dy1 * (x - x1) and
+                    dx2 * (y - y2) > dy2 * (x - x2) and dx3 * (y - y3) > dy3 * (x - x3))]
+
+def convex_hull(points: Union[List[Point], PointArray]) -> List[Point]:
     """Calculate convex hull using Graham scan algorithm."""
     if len(points) < 3:
-        return points
+        return points if not isinstance(points, PointArray) else points.to_points()
+    
+    coords = points if isinstance(points, PointArray) else PointArray.from_points(points)
+    xs, ys = coords.xs, coords.ys
+    n = len(xs)
     
     # Find the bottom-most point (or left most in case of tie)
-    start = min(points, key=lambda p: (p.y, p.x))
+    start = min(range(n), key=lambda i: (ys[i], xs[i]))
+    sx, sy = xs[start], ys[start]
     
-    # Sort points by polar angle with respect to start point
-    def polar_angle(p):
-        return math.atan2(p.y - start.y, p.x - start.x)
+    # Large inputs first drop points that can't be on the hull
+    candidates = _hull_candidates(xs, ys) if n >= _HULL_PREFILTER_MIN_POINTS else range(n)
     
-    sorted_points = sorted([p for p in points if p != start], key=polar_angle)
+    # Sort the other points by polar angle with respect to start point,
+    # comparing coordinates rather than Point objects. Every point lies at
+    # or above start (angle 0..pi), where -dx / (|dx| + dy) increases
+    # monotonically with the angle, so no atan2 is needed.
+    order = [i for i in candidates if xs[i] != sx or ys[i] != sy]
+    order.sort(key=lambda i: (sx - xs[i]) / (abs(xs[i] - sx) + (ys[i] - sy)))
     
-    # Build convex hull
-    hull = [start]
+    # Build convex hull on a preallocated index stack
+    stack = [start] * (len(order) + 1)
+    top = 0
     
-    for point in sorted_points:
+    for i in order:
+        px, py = xs[i], ys[i]
+        
         # Remove points that create a right turn
-        while len(hull) > 1:
-            # Calculate cross product to determine turn direction
-            v1 = hull[-1] - hull[-2]
-            v2 = point - hull[-1]
-            cross = v1.x * v2.y - v1.y * v2.x
+        while top > 0:
+            a, b = stack[top - 1], stack[top]
+            bx, by = xs[b], ys[b]
+            cross = (bx - xs[a]) * (py - by) - (by - ys[a]) * (px - bx)
             
             if cross <= 0:  # Right turn or collinear
-                hull.pop()
+                top -= 1
             else:
                 break
         
-        hull.append(point)
+        top += 1
+        stack[top] = i
     
-    return hull
+    if isinstance(points, PointArray):
+        return [Point(xs[i], ys[i]) for i in stack[:top + 1]]
+    return [points[i] for i in stack[:top + 1]]
 
-def bounding_box(points: List[Point]) -> Rectangle:
+def bounding_box(points: Union[List[Point], PointArray]) -> Rectangle:
     """Calculate bounding box for a list of points."""
-    if not points:
+    if not len(points):
         return Rectangle(0, 0, 0, 0)
     
-    min_x = min(p.x for p in points)
-    max_x = max(p.x for p in points)
-    min_y = min(p.y for p in points)
-    max_y = max(p.y for p in points)
+    # Gather each column once (no array copy for plain lists); the
+    # min/max reductions then run in C
+    if isinstance(points, PointArray):
+        xs, ys = points.xs, points.ys
+    else:
+        xs = [p.x for p in points]
+        ys = [p.y for p in points]
+    
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
     
     return Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
 
@@ -432,18 +679,31 @@ def bezier_curve(control_points: List[Point], t: float) -> Point:
     if len(control_points) == 1:
         return control_points[0]
     
-    # De Casteljau's algorithm
-    points = control_points[:]
-    
-    while len(points) > 1:
-        new_points = []
-        for i in range(len(points) - 1):
-            x = points[i].x + t * (points[i + 1].x - points[i].x)
-            y = points[i].y + t * (points[i + 1].y - points[i].y)
-            new_points.append(Point(x, y))
-        points = new_points
-    
-    return points[0]
+    return bezier_curve_batch(control_points, (t,))[0]
+
+def bezier_curve_batch(control_points: Union[List[Point], PointArray],
+                       ts: Iterable[float]) -> PointArray:
+    """Calculate points on a Bezier curve for many parameter values."""
+    if not isinstance(control_points, PointArray):
+        control_points = PointArray.from_points(control_points)
+    
+    control_xs, control_ys = control_points.xs.tolist(), control_points.ys.tolist()
+    if not control_xs:
+        control_xs, control_ys = [0.0], [0.0]  # Same as bezier_curve with no points
+    degrees = range(len(control_xs) - 1, 0, -1)
+    out_xs, out_ys = [], []
+    
+    for t in ts:
+        # De Casteljau's algorithm, reducing one working row in place
+        xs, ys = control_xs[:], control_ys[:]
+        for k in degrees:
+            for i in range(k):
+                xs[i] += t * (xs[i + 1] - xs[i])
+                ys[i] += t * (ys[i + 1] - ys[i])
+        out_xs.append(xs[0])
+        out_ys.append(ys[0])
+    
+    return PointArray(out_xs, out_ys)
 
 def line_intersection(line1_start: Point, line1_end: Point,
                      line2_start: Point, line2_end: Point) -> Optional[Point]:
@@ -468,34 +728,101 @@ def line_intersection(line1_start: Point, line1_end: Point,
     
     return None
 
+def line_intersections_batch(line_start: Point, line_end: Point,
+                             other_starts: Union[List[Point], PointArray],
+                             other_ends: Union[List[Point], PointArray]) -> List[Optional[Point]]:
+    """Intersect one line segment with many others.
+    
+    Returns the intersection point (or None) for each segment pair
+    (other_starts[i], other_ends[i]), like line_intersection.
+    """
+    if not isinstance(other_starts, PointArray):
+        other_starts = PointArray.from_points(other_starts)
+    if not isinstance(other_ends, PointArray):
+        other_ends = PointArray.from_points(other_ends)
+    
+    # Direction of the shared segment is computed once
+    x1, y1 = line_start.x, line_start.y
+    ax = x1 - line_end.x
+    ay = y1 - line_end.y
+    
+    results: List[Optional[Point]] = []
+    append = results.append
+    for x3, y3, x4, y4 in zip(other_starts.xs, other_starts.ys, other_ends.xs, other_ends.ys):
+        bx = x3 - x4
+        by = y3 - y4
+        denom = ax * by - ay * bx
+        if abs(denom) < 1e-10:
+            append(None)  # Lines are parallel
+            continue
+        
+        rx = x1 - x3
+        ry = y1 - y3
+        t = (rx * by - ry * bx) / denom
+        u = (ay * rx - ax * ry) / denom
+        
+        if 0 <= t <= 1 and 0 <= u <= 1:
+            append(Point(x1 - t * ax, y1 - t * ay))
+        else:
+            append(None)
+    
+    return results
+
 def grid_snap(point: Point, grid_size: float) -> Point:
     """Snap point to grid."""
     x = round(point.x / grid_size) * grid_size
     y = round(point.y / grid_size) * grid_size
     return Point(x, y)
 
+def grid_snap_batch(points: Union[List[Point], PointArray], grid_size: float) -> PointArray:
+    """Snap many points to grid (same rounding as grid_snap)."""
+    if not isinstance(points, PointArray):
+        points = PointArray.from_points(points)
+    
+    return PointArray(
+        [round(x / grid_size) * grid_size for x in points.xs],
+        [round(y / grid_size) * grid_size for y in points.ys]
+    )
+
+def _rect_mapping(source: Rectangle, target: Rectangle) -> Tuple[float, float, float, float]:
+    """Get (scale_x, scale_y, offset_x, offset_y) mapping source onto target.
+    
+    A point maps as x * scale_x + offset_x, y * scale_y + offset_y.
+    """
+    scale_x = target.width / source.width
+    scale_y = target.height / source.height
+    return scale_x, scale_y, target.x - source.x * scale_x, target.y - source.y * scale_y
+
 def viewport_transform(point: Point, viewport: Rectangle, 
                       world_bounds: Rectangle) -> Point:
     """Transform world coordinates to viewport coordinates."""
-    # Calculate scale factors
-    scale_x = viewport.width / world_bounds.width
-    scale_y = viewport.height / world_bounds.height
-    
-    # Transform coordinates
-    x = viewport.x + (point.x - world_bounds.x) * scale_x
-    y = viewport.y + (point.y - world_bounds.y) * scale_y
-    
-    return Point(x, y)
+    scale_x, scale_y, offset_x, offset_y = _rect_mapping(world_bounds, viewport)
+    return Point(point.x * scale_x + offset_x, point.y * scale_y + offset_y)
 
 def inverse_viewport_transform(point: Point, viewport: Rectangle,
                               world_bounds: Rectangle) -> Point:
     """Transform viewport coordinates to world coordinates."""
-    # Calculate scale factors
-    scale_x = world_bounds.width / viewport.width
-    scale_y = world_bounds.height / viewport.height
-    
-    # Transform coordinates
-    x = world_bounds.x + (point.x - viewport.x) * scale_x
-    y = world_bounds.y + (point.y - viewport.y) * scale_y
-    
-    return Point(x, y)
+    scale_x, scale_y, offset_x, offset_y = _rect_mapping(viewport, world_bounds)
+    return Point(point.x * scale_x + offset_x, point.y * scale_y + offset_y)
+
+def viewport_transform_batch(points: Union[List[Point], PointArray], viewport: Rectangle,
+                             world_bounds: Rectangle) -> PointArray:
+    """Transform many world points to viewport coordinates."""
+    return _map_rect_batch(points, world_bounds, viewport)
+
+def inverse_viewport_transform_batch(points: Union[List[Point], PointArray], viewport: Rectangle,
+                                     world_bounds: Rectangle) -> PointArray:
+    """Transform many viewport points to world coordinates."""
+    return _map_rect_batch(points, viewport, world_bounds)
+
+def _map_rect_batch(points: Union[List[Point], PointArray], source: Rectangle,
+                    target: Rectangle) -> PointArray:
+    """Map points from source rectangle space onto target rectangle space."""
+    if not isinstance(points, PointArray):
+        points = PointArray.from_points(points)
+    
+    scale_x, scale_y, offset_x, offset_y = _rect_mapping(source, target)
+    return PointArray(
+        [x * scale_x + offset_x for x in points.xs],
+        [y * scale_y + offset_y for y in points.ys]
+    )
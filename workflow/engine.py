@@ -11,33 +11,83 @@ from concurrent.futures import ThreadPoolExecutor, Future
 import traceback
 from datetime import datetime
 
-from workflow.execution import WorkflowExecution
+from workflow.execution import WorkflowExecution, CircularDependencyError
 from workflow.serializer import WorkflowSerializer
 from nodes.node_factory import NodeFactory
 
+# Pin types each output type may connect to, including itself and "any"
+_COMPAT: Dict[str, frozenset] = {
+    from_type: frozenset((from_type, "any", *to_types))
+    for from_type, to_types in {
+        "string": ("text",),
+        "text": ("string",),
+        "number": ("integer", "float"),
+        "integer": ("number", "float"),
+        "float": ("number", "integer"),
+        "object": ("json", "dict"),
+        "json": ("object", "dict"),
+        "dict": ("object", "json")
+    }.items()
+}
+
+# Longest a waiting execute_workflow call blocks for a free execution slot, in seconds
+_ADMISSION_TIMEOUT = 5.0
+
 class WorkflowEngine:
     """Thread-safe workflow execution engine."""
     
-    def __init__(self, max_workers: int = 4):
-        """Initialize the workflow engine."""
+    def __init__(self, max_workers: int = 4, debug: bool = True):
+        """Initialize the workflow engine.
+        
+        With debug False, executions skip DEBUG-only work such as formatting
+        tracebacks and describing data transfers.
+        """
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Separate pool for nodes so executions never wait on their own workers
+        self.node_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow-node")
         self.node_factory = NodeFactory()
         self.serializer = WorkflowSerializer()
         
-        # Active executions
+        # Active executions; single-key updates rely on dict atomicity under
+        # the GIL, the lock only serializes stopping everything at once
         self.active_executions: Dict[str, WorkflowExecution] = {}
         self.execution_lock = threading.Lock()
         
+        # Required property names per node type, filled on first use
+        self._required_props_cache: Dict[str, tuple] = {}
+        
+        # Bounds executions queued or running so bursts cannot pile up in memory
+        self._admission = threading.BoundedSemaphore(max_workers * 4)
+        
         # Engine state
         self.is_running = True
+        self.debug_enabled = debug
+        self._executor_shutdown = False
         
     def execute_workflow(self, workflow_data: Dict, 
                         on_log: Optional[Callable] = None,
                         on_node_update: Optional[Callable] = None,
-                        on_complete: Optional[Callable] = None) -> str:
-        """Execute a workflow asynchronously."""
-        execution_id = str(uuid.uuid4())
+                        on_complete: Optional[Callable] = None,
+                        on_log_batch: Optional[Callable] = None,
+                        wait: bool = True) -> Optional[str]:
+        """Execute a workflow asynchronously.
+        
+        When the engine is saturated this waits up to _ADMISSION_TIMEOUT
+        seconds for a slot (not at all if wait is False) and returns None
+        if none frees up.
+        """
+        if wait:
+            admitted = self._admission.acquire(timeout=_ADMISSION_TIMEOUT)
+        else:
+            admitted = self._admission.acquire(blocking=False)
+        
+        if not admitted:
+            if on_log:
+                on_log("WARNING", "Workflow execution rejected: too many executions pending")
+            return None
+        
+        execution_id = uuid.uuid4().hex
         
         # Create execution instance
         execution = WorkflowExecution(
@@ -45,15 +95,25 @@ class WorkflowEngine:
             workflow_data=workflow_data,
             node_factory=self.node_factory,
             on_log=on_log,
-            on_node_update=on_node_update
+            on_node_update=on_node_update,
+            debug=self.debug_enabled,
+            node_executor=self.node_executor,
+            on_log_batch=on_log_batch
         )
         
         # Store execution
-        with self.execution_lock:
-            self.active_executions[execution_id] = execution
+        self.active_executions[execution_id] = execution
         
         # Submit for execution
-        future = self.executor.submit(self._execute_workflow_internal, execution, on_complete)
+        try:
+            future = self.executor.submit(self._execute_workflow_internal, execution, on_complete)
+        except Exception:
+            self.active_executions.pop(execution_id, None)
+            self._admission.release()
+            raise
+        
+        # Free the slot once the run finishes, or if it is cancelled before starting
+        future.add_done_callback(self._release_admission)
         execution.future = future
         
         if on_log:
@@ -74,8 +134,11 @@ class WorkflowEngine:
             if validation_errors:
                 raise ValueError(f"Workflow validation failed: {', '.join(validation_errors)}")
             
-            # Execute the workflow
-            execution.execute()
+            # Execute the workflow; its topological sort also detects cycles
+            try:
+                execution.execute()
+            except CircularDependencyError as e:
+                raise ValueError(f"Workflow validation failed: {e}") from e
             success = True
             
             if execution.on_log:
@@ -86,39 +149,47 @@ class WorkflowEngine:
             error_message = str(e)
             if execution.on_log:
                 execution.on_log("ERROR", f"Workflow execution failed: {error_message}")
-                execution.on_log("DEBUG", traceback.format_exc())
+                if self.debug_enabled:
+                    execution.on_log("DEBUG", traceback.format_exc())
         
         finally:
             # Clean up
-            with self.execution_lock:
-                if execution.execution_id in self.active_executions:
-                    del self.active_executions[execution.execution_id]
+            self.active_executions.pop(execution.execution_id, None)
             
             # Notify completion
             if on_complete:
                 try:
                     on_complete(success, error_message)
                 except Exception as e:
-                    print(f"Error in completion callback: {e}")
+                    if execution.on_log:
+                        execution.on_log("ERROR", f"Error in completion callback: {e}")
+    
+    def _release_admission(self, future: Future):
+        """Return an execution slot to the admission semaphore."""
+        self._admission.release()
     
     def stop_execution(self, execution_id: Optional[str] = None):
         """Stop a specific execution or all executions."""
-        with self.execution_lock:
-            if execution_id:
-                # Stop specific execution
-                if execution_id in self.active_executions:
-                    execution = self.active_executions[execution_id]
-                    execution.stop()
-                    if hasattr(execution, 'future'):
-                        execution.future.cancel()
-            else:
-                # Stop all executions
-                for execution in self.active_executions.values():
-                    execution.stop()
-                    if hasattr(execution, 'future'):
-                        execution.future.cancel()
-                
-                self.active_executions.clear()
+        if execution_id:
+            # Stop specific execution
+            execution = self.active_executions.get(execution_id)
+            targets = [execution] if execution else []
+        else:
+            # Stop all executions; popping one at a time also catches
+            # executions registered while draining
+            targets = []
+            with self.execution_lock:
+                while True:
+                    try:
+                        targets.append(self.active_executions.popitem()[1])
+                    except KeyError:
+                        break
+        
+        # Stopping happens outside the lock
+        for execution in targets:
+            execution.stop()
+            if hasattr(execution, 'future'):
+                execution.future.cancel()
     
     def stop_all_executions(self):
         """Stop all active executions and shutdown engine."""
@@ -127,9 +198,15 @@ class WorkflowEngine:
         
         # Shutdown executor
         self.executor.shutdown(wait=True)
+        self.node_executor.shutdown(wait=True)
+        self._executor_shutdown = True
     
     def validate_workflow(self, workflow_data: Dict) -> List[str]:
-        """Validate a workflow and return list of errors."""
+        """Validate a workflow and return list of errors.
+        
+        Circular dependencies are not checked here; the execution's
+        topological sort reports them.
+        """
         errors = []
         
         try:
@@ -141,15 +218,16 @@ class WorkflowEngine:
                 node_errors = self._validate_node(node_id, node_data)
                 errors.extend(node_errors)
             
+            # Pins by name per node, indexed on first use by the connection checks
+            out_pins = {}
+            in_pins = {}
+            
             # Validate connections
             for connection_id, connection_data in connections.items():
-                connection_errors = self._validate_connection(connection_id, connection_data, nodes)
+                connection_errors = self._validate_connection(connection_id, connection_data, nodes,
+                                                              out_pins, in_pins)
                 errors.extend(connection_errors)
             
-            # Check for circular dependencies
-            circular_errors = self._check_circular_dependencies(nodes, connections)
-            errors.extend(circular_errors)
-            
             # Check for disconnected nodes
             if nodes and not connections:
                 errors.append("Workflow has nodes but no connections")
@@ -178,8 +256,11 @@ class WorkflowEngine:
         # Validate node properties
         if node_type:
             try:
-                node_info = self.node_factory.get_node_info(node_type)
-                required_props = node_info.get("required_properties", [])
+                required_props = self._required_props_cache.get(node_type)
+                if required_props is None:
+                    node_info = self.node_factory.get_node_info(node_type)
+                    required_props = tuple(node_info.get("required_properties", ()))
+                    self._required_props_cache[node_type] = required_props
                 node_props = node_data.get("properties", {})
                 
                 for required_prop in required_props:
@@ -192,7 +273,7 @@ class WorkflowEngine:
         return errors
     
     def _validate_connection(self, connection_id: str, connection_data: Dict, 
-                           nodes: Dict) -> List[str]:
+                           nodes: Dict, out_pins: Dict[str, Dict], in_pins: Dict[str, Dict]) -> List[str]:
         """Validate a single connection."""
         errors = []
         
@@ -214,33 +295,44 @@ class WorkflowEngine:
         
         # Validate pin compatibility
         if from_node and to_node and from_node in nodes and to_node in nodes:
-            pin_errors = self._validate_pin_compatibility(connection_data, nodes)
+            pin_errors = self._validate_pin_compatibility(connection_data, nodes, out_pins, in_pins)
             errors.extend(pin_errors)
         
         return errors
     
-    def _validate_pin_compatibility(self, connection_data: Dict, nodes: Dict) -> List[str]:
-        """Validate that connected pins are compatible."""
+    def _pin_index(self, pins_by_node: Dict[str, Dict], nodes: Dict, node_id: str,
+                   direction: str) -> Dict[str, Dict]:
+        """Get a node's "inputs" or "outputs" pins by name, indexing them on first use."""
+        index = pins_by_node.get(node_id)
+        if index is None:
+            index = {}
+            for pin in nodes[node_id].get(direction, []):
+                # The first pin with a name wins, as with a linear search
+                index.setdefault(pin["name"], pin)
+            pins_by_node[node_id] = index
+        return index
+    
+    def _validate_pin_compatibility(self, connection_data: Dict, nodes: Dict,
+                                    out_pins: Dict[str, Dict], in_pins: Dict[str, Dict]) -> List[str]:
+        """Validate that connected pins are compatible.
+        
+        out_pins and in_pins are per-validation caches filled by _pin_index.
+        """
         errors = []
         
         try:
-            from_node_data = nodes[connection_data["from_node"]]
-            to_node_data = nodes[connection_data["to_node"]]
-            
             from_pin = connection_data["from_pin"]
             to_pin = connection_data["to_pin"]
             
             # Find output pin in source node
-            from_outputs = from_node_data.get("outputs", [])
-            from_pin_info = next((p for p in from_outputs if p["name"] == from_pin), None)
+            from_pin_info = self._pin_index(out_pins, nodes, connection_data["from_node"], "outputs").get(from_pin)
             
             if not from_pin_info:
                 errors.append(f"Output pin '{from_pin}' not found in source node")
                 return errors
             
             # Find input pin in target node
-            to_inputs = to_node_data.get("inputs", [])
-            to_pin_info = next((p for p in to_inputs if p["name"] == to_pin), None)
+            to_pin_info = self._pin_index(in_pins, nodes, connection_data["to_node"], "inputs").get(to_pin)
             
             if not to_pin_info:
                 errors.append(f"Input pin '{to_pin}' not found in target node")
@@ -250,7 +342,14 @@ class WorkflowEngine:
             from_type = from_pin_info.get("type", "any")
             to_type = to_pin_info.get("type", "any")
             
-            if not self._are_types_compatible(from_type, to_type):
+            # Inlined _are_types_compatible
+            compatible_types = _COMPAT.get(from_type)
+            if compatible_types is None:
+                compatible = from_type == to_type or from_type == "any" or to_type == "any"
+            else:
+                compatible = to_type in compatible_types
+            
+            if not compatible:
                 errors.append(f"Incompatible types: {from_type} -> {to_type}")
         
         except Exception as e:
@@ -260,115 +359,51 @@ class WorkflowEngine:
     
     def _are_types_compatible(self, from_type: str, to_type: str) -> bool:
         """Check if two pin types are compatible."""
-        # "any" type is compatible with everything
-        if from_type == "any" or to_type == "any":
-            return True
-        
-        # Exact match
-        if from_type == to_type:
-            return True
-        
-        # Define compatibility rules
-        compatibility_rules = {
-            "string": ["text"],
-            "text": ["string"],
-            "number": ["integer", "float"],
-            "integer": ["number", "float"],
-            "float": ["number", "integer"],
-            "object": ["json", "dict"],
-            "json": ["object", "dict"],
-            "dict": ["object", "json"]
-        }
-        
-        compatible_types = compatibility_rules.get(from_type, [])
+        compatible_types = _COMPAT.get(from_type)
+        if compatible_types is None:
+            # "any" is compatible with everything; unknown types only match exactly
+            return from_type == to_type or from_type == "any" or to_type == "any"
         return to_type in compatible_types
     
-    def _check_circular_dependencies(self, nodes: Dict, connections: Dict) -> List[str]:
-        """Check for circular dependencies in the workflow."""
-        errors = []
-        
-        try:
-            # Build adjacency list
-            graph = {node_id: [] for node_id in nodes.keys()}
-            
-            for connection in connections.values():
-                from_node = connection["from_node"]
-                to_node = connection["to_node"]
-                if from_node in graph:
-                    graph[from_node].append(to_node)
-            
-            # Use DFS to detect cycles
-            visited = set()
-            rec_stack = set()
-            
-            def has_cycle(node):
-                if node in rec_stack:
-                    return True
-                if node in visited:
-                    return False
-                
-                visited.add(node)
-                rec_stack.add(node)
-                
-                for neighbor in graph.get(node, []):
-                    if has_cycle(neighbor):
-                        return True
-                
-                rec_stack.remove(node)
-                return False
-            
-            for node_id in nodes.keys():
-                if node_id not in visited:
-                    if has_cycle(node_id):
-                        errors.append("Circular dependency detected in workflow")
-                        break
-        
-        except Exception as e:
-            errors.append(f"Circular dependency check error: {str(e)}")
-        
-        return errors
-    
     def get_execution_status(self, execution_id: str) -> Optional[Dict]:
         """Get status of a specific execution."""
-        with self.execution_lock:
-            execution = self.active_executions.get(execution_id)
-            if execution:
-                return {
-                    "execution_id": execution_id,
-                    "status": execution.status,
-                    "current_node": execution.current_node_id,
-                    "progress": execution.get_progress(),
-                    "start_time": execution.start_time,
-                    "errors": execution.errors
-                }
+        execution = self.active_executions.get(execution_id)
+        if execution:
+            return self._build_status(execution_id, execution)
         return None
     
     def get_all_execution_statuses(self) -> List[Dict]:
         """Get status of all active executions."""
-        statuses = []
-        with self.execution_lock:
-            for execution_id in self.active_executions.keys():
-                status = self.get_execution_status(execution_id)
-                if status:
-                    statuses.append(status)
-        return statuses
+        # Snapshot the map, then read each execution from the copy
+        items = list(self.active_executions.items())
+        return [self._build_status(execution_id, execution) for execution_id, execution in items]
+    
+    def _build_status(self, execution_id: str, execution: WorkflowExecution) -> Dict:
+        """Build the status dict for an execution."""
+        return {
+            "execution_id": execution_id,
+            "status": execution.status,
+            "current_node": execution.current_node_id,
+            "running_nodes": sorted(execution.running_nodes.copy()),
+            "progress": execution.get_progress(),
+            "start_time": execution.start_time,
+            "errors": execution.errors
+        }
     
     def is_execution_running(self, execution_id: str) -> bool:
         """Check if a specific execution is still running."""
-        with self.execution_lock:
-            return execution_id in self.active_executions
+        # Dict membership and truthiness are atomic under the GIL; no lock needed
+        return execution_id in self.active_executions
     
     def has_active_executions(self) -> bool:
         """Check if there are any active executions."""
-        with self.execution_lock:
-            return len(self.active_executions) > 0
+        return bool(self.active_executions)
     
     def get_engine_stats(self) -> Dict:
         """Get engine statistics."""
-        with self.execution_lock:
-            return {
-                "active_executions": len(self.active_executions),
-                "max_workers": self.max_workers,
-                "is_running": self.is_running,
-                "executor_shutdown": self.executor._shutdown
-            }
+        return {
+            "active_executions": len(self.active_executions),
+            "max_workers": self.max_workers,
+            "is_running": self.is_running,
+            "executor_shutdown": self._executor_shutdown
+        }
@@ -3,18 +3,50 @@ Workflow execution implementation with topological sorting and data flow.
 Handles individual workflow execution with node dependencies and data passing.
 """
 
-import time
+import heapq
+import types
+import sys
 import threading
-from typing import Dict, List, Optional, Callable, Any, Set
+import time
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple
 from datetime import datetime
+from concurrent.futures import Executor
 import traceback
-import copy
 
 # Import moved to avoid circular dependency
 from utils.geometry import Point
 
+# Buffered callbacks are flushed after this many log events, or this many seconds after buffering starts
+_CALLBACK_BATCH_SIZE = 32
+_CALLBACK_FLUSH_INTERVAL = 0.1
+
+class CircularDependencyError(ValueError):
+    """Raised when the workflow graph contains a cycle."""
+    pass
+
+def _describe_size(value: Any) -> str:
+    """Describe a payload's size cheaply, without stringifying it."""
+    if isinstance(value, str):
+        return f"{len(value)} chars"
+    if isinstance(value, (bytes, bytearray)):
+        return f"{len(value)} bytes"
+    try:
+        return f"{len(value)} items"
+    except TypeError:
+        pass
+    try:
+        return f"{sys.getsizeof(value)} bytes"
+    except TypeError:
+        return "<unsized>"
+
 class ExecutionContext:
-    """Context for workflow execution containing shared data and state."""
+    """Context for workflow execution containing shared data and state.
+    
+    Single-key reads and writes rely on dict operations being atomic under
+    the GIL, so they take no lock.
+    """
+    
+    __slots__ = ("data_store", "global_variables", "execution_id", "start_time")
     
     def __init__(self):
         """Initialize execution context."""
@@ -22,54 +54,98 @@ class ExecutionContext:
         self.global_variables: Dict[str, Any] = {}
         self.execution_id: str = ""
         self.start_time: datetime = datetime.now()
-        self.lock = threading.Lock()
     
     def get_data(self, key: str, default: Any = None) -> Any:
         """Get data from the context store."""
-        with self.lock:
-            return self.data_store.get(key, default)
+        return self.data_store.get(key, default)
     
     def set_data(self, key: str, value: Any):
         """Set data in the context store."""
-        with self.lock:
-            self.data_store[key] = value
+        self.data_store[key] = value
+    
+    def setdefault_data(self, key: str, default: Any = None) -> Any:
+        """Get data from the context store, storing default if the key is missing."""
+        return self.data_store.setdefault(key, default)
     
     def get_variable(self, name: str, default: Any = None) -> Any:
         """Get a global variable."""
-        with self.lock:
-            return self.global_variables.get(name, default)
+        return self.global_variables.get(name, default)
     
     def set_variable(self, name: str, value: Any):
         """Set a global variable."""
-        with self.lock:
-            self.global_variables[name] = value
+        self.global_variables[name] = value
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a consistent shallow copy of the context store."""
+        return self.data_store.copy()
 
 class WorkflowExecution:
     """Handles execution of a single workflow with dependency management."""
     
+    __slots__ = (
+        "execution_id", "workflow_data", "node_factory", "on_log", "on_node_update",
+        "_debug", "node_executor", "_nodes", "_connections",
+        "status", "current_node_id", "start_time", "end_time", "errors", "stop_requested",
+        "context", "completed_nodes", "failed_nodes", "node_outputs", "execution_order",
+        "_inbound", "_instances", "future", "on_log_batch", "_log_buffer", "_status_buffer",
+        "_buffer_lock", "_delivery_lock", "_flush_timer", "running_nodes", "_halted"
+    )
+    
     def __init__(self, execution_id: str, workflow_data: Dict, 
                  node_factory: Any,
                  on_log: Optional[Callable] = None,
-                 on_node_update: Optional[Callable] = None):
-        """Initialize workflow execution."""
+                 on_node_update: Optional[Callable] = None,
+                 debug: bool = True,
+                 node_executor: Optional[Executor] = None,
+                 on_log_batch: Optional[Callable] = None):
+        """Initialize workflow execution.
+        
+        With a node_executor, independent nodes in the same DAG layer run
+        concurrently on it; otherwise nodes run one at a time.
+        
+        With on_log_batch, log events are buffered and delivered as lists of
+        (level, message, node_id, details) tuples instead of going to on_log,
+        and node status updates are coalesced to the latest status per node.
+        A timer delivers whatever is buffered within _CALLBACK_FLUSH_INTERVAL,
+        and a node switching to "running" is delivered immediately.
+        """
         self.execution_id = execution_id
-        self.workflow_data = workflow_data
+        # Read-only view: the execution never copies or mutates the workflow
+        self.workflow_data = types.MappingProxyType(workflow_data)
+        self._nodes: Dict[str, Dict] = workflow_data.get("nodes", {})
+        self._connections: Dict[str, Dict] = workflow_data.get("connections", {})
         self.node_factory = node_factory
         self.on_log = on_log
         self.on_node_update = on_node_update
+        self.on_log_batch = on_log_batch
+        self._debug = debug and (on_log is not None or on_log_batch is not None)
+        self.node_executor = node_executor
         
         # Execution state
         self.status = "pending"
+        # Last node started; with a node_executor several nodes may run at once
         self.current_node_id: Optional[str] = None
+        self.running_nodes: Set[str] = set()
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.errors: List[str] = []
         self.stop_requested = False
+        # Set when a critical node fails so its layer siblings are not started
+        self._halted = False
         
         # Execution context
         self.context = ExecutionContext()
         self.context.execution_id = execution_id
         
+        # Buffered callbacks, used when on_log_batch is set
+        self._log_buffer: List[Tuple] = []
+        self._status_buffer: Dict[str, str] = {}
+        self._buffer_lock = threading.Lock()
+        # Serializes delivery so batches reach the callbacks in order; reentrant
+        # so a callback that logs back into this execution cannot deadlock
+        self._delivery_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        
         # Node execution tracking
         self.completed_nodes: Set[str] = set()
         self.failed_nodes: Set[str] = set()
@@ -78,6 +154,12 @@ class WorkflowExecution:
         # Execution order
         self.execution_order: List[str] = []
         
+        # Inbound connections per target node, built once per run
+        self._inbound: Dict[str, List[Tuple[str, str, str]]] = {}
+        
+        # Node instances created up front, keyed by node id
+        self._instances: Dict[str, Any] = {}
+        
     def execute(self):
         """Execute the workflow."""
         self.start_time = datetime.now()
@@ -88,6 +170,8 @@ class WorkflowExecution:
             
             # Build execution order
             self.execution_order = self._build_execution_order()
+            self._inbound = self._build_inbound_index()
+            self._instances = self._create_node_instances()
             
             if not self.execution_order:
                 self._log("WARNING", "No nodes to execute")
@@ -96,29 +180,33 @@ class WorkflowExecution:
             
             self._log("INFO", f"Execution order: {' -> '.join(self.execution_order)}")
             
-            # Execute nodes in order
-            for node_id in self.execution_order:
+            # Execute nodes in order, one layer of independent nodes at a time
+            if self.node_executor is None:
+                batches = [[node_id] for node_id in self.execution_order]
+            else:
+                batches = self._build_execution_layers()
+            
+            for batch in batches:
                 if self.stop_requested:
-                    self._log("INFO", "Execution stopped by request")
-                    self.status = "stopped"
-                    return
+                    break
+                
+                if len(batch) == 1:
+                    self._run_node(batch[0])
+                else:
+                    # Nodes check stop and critical failures before starting
+                    list(self.node_executor.map(self._run_node, batch))
                 
-                try:
-                    self._execute_node(node_id)
-                    self.completed_nodes.add(node_id)
-                    
-                except Exception as e:
-                    error_msg = f"Node {node_id} failed: {str(e)}"
-                    self.errors.append(error_msg)
-                    self.failed_nodes.add(node_id)
-                    self._log("ERROR", error_msg)
-                    self._log("DEBUG", traceback.format_exc())
-                    
-                    # Check if this is a critical failure
-                    if self._is_critical_node(node_id):
-                        self._log("ERROR", "Critical node failed, stopping execution")
-                        self.status = "failed"
-                        return
+                # Check if this is a critical failure
+                if self._halted:
+                    self._log("ERROR", "Critical node failed, stopping execution")
+                    self.status = "failed"
+                    return
+            
+            # A stop may also arrive while the last layer runs
+            if self.stop_requested:
+                self._log("INFO", "Execution stopped by request")
+                self.status = "stopped"
+                return
             
             # Check final status
             if self.failed_nodes:
@@ -128,62 +216,122 @@ class WorkflowExecution:
                 self.status = "completed"
                 self._log("SUCCESS", "Workflow execution completed successfully")
         
+        except CircularDependencyError as e:
+            # Reported by the engine as a validation failure
+            self.status = "failed"
+            self.errors.append(str(e))
+            raise
+        
         except Exception as e:
             self.status = "failed"
             error_msg = f"Workflow execution failed: {str(e)}"
             self.errors.append(error_msg)
             self._log("ERROR", error_msg)
-            self._log("DEBUG", traceback.format_exc())
+            if self._debug:
+                self._log("DEBUG", traceback.format_exc())
         
         finally:
             self.end_time = datetime.now()
             self.current_node_id = None
+            self.flush_callbacks()
     
     def _build_execution_order(self) -> List[str]:
         """Build the execution order using topological sort."""
-        nodes = self.workflow_data.get("nodes", {})
-        connections = self.workflow_data.get("connections", {})
+        nodes = self._nodes
+        connections = self._connections
         
-        # Build dependency graph
+        # Build dependency graph (duplicate edges count once)
         dependencies = {node_id: set() for node_id in nodes.keys()}
+        successors: Dict[str, List[str]] = {node_id: [] for node_id in nodes.keys()}
         
         for connection in connections.values():
             from_node = connection.get("from_node")
             to_node = connection.get("to_node")
             
             if from_node and to_node and from_node in nodes and to_node in nodes:
-                dependencies[to_node].add(from_node)
+                deps = dependencies[to_node]
+                if from_node not in deps:
+                    deps.add(from_node)
+                    successors[from_node].append(to_node)
         
         # Topological sort using Kahn's algorithm
         in_degree = {node_id: len(deps) for node_id, deps in dependencies.items()}
         queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        # Min-heap keeps the execution order deterministic
+        heapq.heapify(queue)
         result = []
         
         while queue:
-            # Sort queue to ensure deterministic execution order
-            queue.sort()
-            current = queue.pop(0)
+            current = heapq.heappop(queue)
             result.append(current)
             
             # Update in-degrees
-            for node_id, deps in dependencies.items():
-                if current in deps:
-                    in_degree[node_id] -= 1
-                    if in_degree[node_id] == 0:
-                        queue.append(node_id)
+            for node_id in successors[current]:
+                in_degree[node_id] -= 1
+                if in_degree[node_id] == 0:
+                    heapq.heappush(queue, node_id)
         
         # Check for circular dependencies
         if len(result) != len(nodes):
             remaining_nodes = set(nodes.keys()) - set(result)
-            raise ValueError(f"Circular dependency detected involving nodes: {remaining_nodes}")
+            raise CircularDependencyError(f"Circular dependency detected involving nodes: {remaining_nodes}")
         
         return result
     
+    def _build_execution_layers(self) -> List[List[str]]:
+        """Group the execution order into layers of mutually independent nodes."""
+        level: Dict[str, int] = {}
+        layers: List[List[str]] = []
+        
+        for node_id in self.execution_order:
+            # A node runs one layer after its deepest dependency
+            node_level = 0
+            for from_node, _, _ in self._inbound.get(node_id, ()):
+                from_level = level.get(from_node)
+                if from_level is not None and from_level >= node_level:
+                    node_level = from_level + 1
+            
+            level[node_id] = node_level
+            if node_level == len(layers):
+                layers.append([])
+            layers[node_level].append(node_id)
+        
+        return layers
+    
+    def _run_node(self, node_id: str) -> bool:
+        """Execute a node and record the outcome; return False if it failed.
+        
+        Nodes not yet started when a stop is requested or a critical node
+        fails are skipped (and count as not failed).
+        """
+        if self.stop_requested or self._halted:
+            return True
+        
+        self.running_nodes.add(node_id)
+        try:
+            self._execute_node(node_id)
+            self.completed_nodes.add(node_id)
+            return True
+        
+        except Exception as e:
+            error_msg = f"Node {node_id} failed: {str(e)}"
+            self.errors.append(error_msg)
+            self.failed_nodes.add(node_id)
+            if self._is_critical_node(node_id):
+                self._halted = True
+            self._log("ERROR", error_msg)
+            if self._debug:
+                self._log("DEBUG", traceback.format_exc())
+            return False
+        
+        finally:
+            self.running_nodes.discard(node_id)
+    
     def _execute_node(self, node_id: str):
         """Execute a single node."""
         self.current_node_id = node_id
         
-        node_data = self.workflow_data["nodes"][node_id]
+        node_data = self._nodes[node_id]
         node_type = node_data["type"]
         
         self._log("INFO", f"Executing node: {node_type}", node_id)
@@ -192,8 +340,10 @@ class WorkflowExecution:
         start_time = time.time()
         
         try:
-            # Create node instance
-            node_instance = self.node_factory.create_node_instance(node_type, node_id, node_data)
+            # Use the prepared instance; recreate it here so a failure is attributed to this node
+            node_instance = self._instances.get(node_id)
+            if node_instance is None:
+                node_instance = self.node_factory.create_node_instance(node_type, node_id, node_data)
             
             # Prepare input data
             input_data = self._prepare_node_inputs(node_id)
@@ -213,29 +363,51 @@ class WorkflowExecution:
             self._update_node_status(node_id, "error")
             raise e
     
+    def _create_node_instances(self) -> Dict[str, Any]:
+        """Create an instance for every node in the execution order."""
+        nodes = self._nodes
+        instances = {}
+        
+        for node_id in self.execution_order:
+            node_data = nodes[node_id]
+            try:
+                instances[node_id] = self.node_factory.create_node_instance(
+                    node_data["type"], node_id, node_data
+                )
+            except Exception:
+                # Left out; _execute_node retries and reports the error for this node
+                pass
+        
+        return instances
+    
+    def _build_inbound_index(self) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Index connections by target node as (from_node, from_pin, to_pin)."""
+        inbound: Dict[str, List[Tuple[str, str, str]]] = {}
+        
+        for connection in self._connections.values():
+            inbound.setdefault(connection.get("to_node"), []).append(
+                (connection.get("from_node"), connection.get("from_pin"), connection.get("to_pin"))
+            )
+        
+        return inbound
+    
     def _prepare_node_inputs(self, node_id: str) -> Dict[str, Any]:
         """Prepare input data for a node based on its connections."""
         input_data = {}
-        connections = self.workflow_data.get("connections", {})
+        node_outputs = self.node_outputs
         
-        # Find all connections that feed into this node
-        for connection in connections.values():
-            if connection.get("to_node") == node_id:
-                from_node = connection.get("from_node")
-                from_pin = connection.get("from_pin")
-                to_pin = connection.get("to_pin")
+        # Only walk the connections that feed into this node
+        for from_node, from_pin, to_pin in self._inbound.get(node_id, ()):
+            source_outputs = node_outputs.get(from_node)
+            
+            if source_outputs is not None and from_pin in source_outputs:
+                value = source_outputs[from_pin]
+                input_data[to_pin] = value
                 
-                if from_node in self.node_outputs:
-                    # Get output data from source node
-                    source_outputs = self.node_outputs[from_node]
-                    
-                    if from_pin in source_outputs:
-                        input_data[to_pin] = source_outputs[from_pin]
-                        
-                        # Log data transfer
-                        data_size = len(str(source_outputs[from_pin]))
-                        self._log("DEBUG", f"Data transfer: {from_pin} -> {to_pin} ({data_size} chars)", 
-                                node_id, {"from_node": from_node, "data_type": type(source_outputs[from_pin]).__name__})
+                # Log data transfer
+                if self._debug:
+                    self._log("DEBUG", f"Data transfer: {from_pin} -> {to_pin} ({_describe_size(value)})",
+                              node_id, {"from_node": from_node, "data_type": type(value).__name__})
         
         return input_data
     
@@ -243,25 +415,88 @@ class WorkflowExecution:
         """Check if a node is critical for workflow execution."""
         # For now, consider all nodes non-critical
         # This could be extended to mark certain nodes as critical
-        node_data = self.workflow_data["nodes"].get(node_id, {})
+        node_data = self._nodes.get(node_id, {})
         return node_data.get("properties", {}).get("critical", False)
     
     def _log(self, level: str, message: str, node_id: Optional[str] = None, 
              details: Optional[Dict] = None):
         """Log a message."""
-        if self.on_log:
+        if self.on_log_batch:
+            with self._buffer_lock:
+                self._log_buffer.append((level, message, node_id, details))
+                flush_now = len(self._log_buffer) >= _CALLBACK_BATCH_SIZE
+                self._arm_flush_timer_locked()
+            if flush_now:
+                self._flush_buffers(blocking=False)
+        elif self.on_log:
             self.on_log(level, message, node_id, details)
     
     def _update_node_status(self, node_id: str, status: str):
         """Update node visual status."""
-        if self.on_node_update:
+        if not self.on_node_update:
+            return
+        
+        if self.on_log_batch:
+            # Only the latest status of each node matters for rendering
+            with self._buffer_lock:
+                self._status_buffer[node_id] = status
+                self._arm_flush_timer_locked()
+            # Show a node as running right away; it may run for a long time
+            if status == "running":
+                self._flush_buffers()
+        else:
             self.on_node_update(node_id, status)
     
+    def _arm_flush_timer_locked(self):
+        """Schedule a timed flush of the buffers unless one is pending (buffer lock held)."""
+        if self._flush_timer is None:
+            timer = threading.Timer(_CALLBACK_FLUSH_INTERVAL, self._flush_buffers)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+    
+    def _flush_buffers(self, blocking: bool = True):
+        """Deliver buffered log events and node statuses.
+        
+        The buffers are swapped out under the buffer lock and the callbacks
+        run after releasing it, so node threads never wait on the UI. A
+        non-blocking flush gives up if another delivery is in progress; the
+        pending timer delivers what it leaves behind.
+        """
+        if not self._delivery_lock.acquire(blocking):
+            return
+        
+        try:
+            with self._buffer_lock:
+                events = self._log_buffer
+                statuses = self._status_buffer
+                self._log_buffer = []
+                self._status_buffer = {}
+                timer = self._flush_timer
+                self._flush_timer = None
+            
+            if timer is not None:
+                timer.cancel()
+            
+            if events:
+                self.on_log_batch(events)
+            
+            for node_id, status in statuses.items():
+                self.on_node_update(node_id, status)
+        finally:
+            self._delivery_lock.release()
+    
+    def flush_callbacks(self):
+        """Deliver any buffered log events and node statuses now."""
+        if self.on_log_batch:
+            self._flush_buffers()
+    
     def stop(self):
         """Request execution stop."""
         self.stop_requested = True
         self.status = "stopping"
         self._log("INFO", "Stop requested")
+        self.flush_callbacks()
     
     def get_progress(self) -> float:
         """Get execution progress as percentage."""
@@ -292,7 +527,8 @@ class WorkflowExecution:
             "completed_nodes": len(self.completed_nodes),
             "failed_nodes": len(self.failed_nodes),
             "errors": self.errors,
-            "current_node": self.current_node_id
+            "current_node": self.current_node_id,
+            "running_nodes": sorted(self.running_nodes.copy())
         }
     
     def get_node_output(self, node_id: str, pin_name: Optional[str] = None) -> Any:
@@ -320,7 +556,7 @@ class WorkflowExecution:
         path = []
         
         for i, node_id in enumerate(self.execution_order):
-            node_data = self.workflow_data["nodes"].get(node_id, {})
+            node_data = self._nodes.get(node_id, {})
             
             path_entry = {
                 "order": i + 1,
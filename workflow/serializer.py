@@ -3,201 +3,510 @@ Workflow serialization and deserialization with validation.
 Handles saving and loading workflows to/from JSON format.
 """
 
+import io
 import json
+import os
+import re
 import jsonschema
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable
 from pathlib import Path
 from datetime import datetime
+import time
 import uuid
 
-class WorkflowSerializer:
-    """Handles workflow serialization with validation and versioning."""
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; large files are parsed in one go otherwise
+    ijson = None
+
+# (epoch second, isoformat string) of the last timestamp handed out
+_timestamp_cache = (0, "")
+
+def _now_iso() -> str:
+    """Current local time as an isoformat string, at one-second resolution.
     
-    def __init__(self):
-        """Initialize the serializer."""
-        self.current_version = "1.0"
-        self.schema = self._create_workflow_schema()
+    The string is formatted once per second and reused for rapid saves.
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, cached_iso = _timestamp_cache
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, cached_iso)
+    return cached_iso
+
+# Buffer size for workflow file writes
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Files at least this large are parsed incrementally when ijson is installed
+_STREAM_LOAD_MIN_BYTES = 8 << 20
+
+def _orjson_dumps_indented(data: Any) -> Optional[bytes]:
+    """Serialize data to indented JSON bytes with orjson, or None if unavailable."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Values orjson rejects (e.g. huge ints) go through stdlib json
+    return None
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when installed."""
+    blob = _orjson_dumps_indented(data)
+    if blob is not None:
+        return blob
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _write_indented(data: Any, file_path: str):
+    """Write data to a file as indented UTF-8 JSON.
     
-    def _create_workflow_schema(self) -> Dict[str, Any]:
-        """Create JSON schema for workflow validation."""
-        return {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Workflow",
+    The stdlib fallback streams encoder chunks through the write buffer
+    instead of building the whole document in memory first.
+    """
+    blob = _orjson_dumps_indented(data)
+    if blob is not None:
+        with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(blob)
+    else:
+        with open(file_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # Let stdlib json accept what it accepts (e.g. NaN) or raise its own error
+    return json.loads(data.decode('utf-8'))
+
+# Canonical lowercase UUID, as generated for node and connection ids
+_UUID_PATTERN = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+# JSON schema for workflow validation
+_WORKFLOW_SCHEMA: Dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Workflow",
+    "type": "object",
+    "required": ["version", "metadata", "nodes"],
+    "properties": {
+        "version": {
+            "type": "string",
+            "pattern": r"^\d+\.\d+$"
+        },
+        "metadata": {
             "type": "object",
-            "required": ["version", "metadata", "nodes"],
+            "required": ["name", "created_at"],
             "properties": {
-                "version": {
-                    "type": "string",
-                    "pattern": r"^\d+\.\d+$"
-                },
-                "metadata": {
+                "name": {"type": "string", "minLength": 1},
+                "description": {"type": "string"},
+                "author": {"type": "string"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "modified_at": {"type": "string", "format": "date-time"},
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                }
+            }
+        },
+        "nodes": {
+            "type": "object",
+            "patternProperties": {
+                _UUID_PATTERN: {
                     "type": "object",
-                    "required": ["name", "created_at"],
+                    "required": ["id", "type", "position"],
                     "properties": {
-                        "name": {"type": "string", "minLength": 1},
-                        "description": {"type": "string"},
-                        "author": {"type": "string"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                        "modified_at": {"type": "string", "format": "date-time"},
-                        "tags": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        }
-                    }
-                },
-                "nodes": {
-                    "type": "object",
-                    "patternProperties": {
-                        "^[a-f0-9-]+$": {
+                        "id": {"type": "string"},
+                        "type": {"type": "string", "minLength": 1},
+                        "title": {"type": "string"},
+                        "position": {
                             "type": "object",
-                            "required": ["id", "type", "position"],
+                            "required": ["x", "y"],
                             "properties": {
-                                "id": {"type": "string"},
-                                "type": {"type": "string", "minLength": 1},
-                                "title": {"type": "string"},
-                                "position": {
-                                    "type": "object",
-                                    "required": ["x", "y"],
-                                    "properties": {
-                                        "x": {"type": "number"},
-                                        "y": {"type": "number"}
-                                    }
-                                },
-                                "properties": {"type": "object"},
-                                "inputs": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "required": ["name", "type"],
-                                        "properties": {
-                                            "name": {"type": "string"},
-                                            "type": {"type": "string"},
-                                            "description": {"type": "string"},
-                                            "required": {"type": "boolean"}
-                                        }
-                                    }
-                                },
-                                "outputs": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "required": ["name", "type"],
-                                        "properties": {
-                                            "name": {"type": "string"},
-                                            "type": {"type": "string"},
-                                            "description": {"type": "string"}
-                                        }
-                                    }
+                                "x": {"type": "number"},
+                                "y": {"type": "number"}
+                            }
+                        },
+                        "properties": {"type": "object"},
+                        "inputs": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "required": ["name", "type"],
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "type": {"type": "string"},
+                                    "description": {"type": "string"},
+                                    "required": {"type": "boolean"}
+                                }
+                            }
+                        },
+                        "outputs": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "required": ["name", "type"],
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "type": {"type": "string"},
+                                    "description": {"type": "string"}
                                 }
                             }
                         }
                     }
-                },
-                "connections": {
+                }
+            }
+        },
+        "connections": {
+            "type": "object",
+            "patternProperties": {
+                _UUID_PATTERN: {
                     "type": "object",
-                    "patternProperties": {
-                        "^[a-f0-9-]+$": {
-                            "type": "object",
-                            "required": ["from_node", "from_pin", "to_node", "to_pin"],
-                            "properties": {
-                                "from_node": {"type": "string"},
-                                "from_pin": {"type": "string"},
-                                "to_node": {"type": "string"},
-                                "to_pin": {"type": "string"},
-                                "metadata": {"type": "object"}
-                            }
-                        }
+                    "required": ["from_node", "from_pin", "to_node", "to_pin"],
+                    "properties": {
+                        "from_node": {"type": "string"},
+                        "from_pin": {"type": "string"},
+                        "to_node": {"type": "string"},
+                        "to_pin": {"type": "string"},
+                        "metadata": {"type": "object"}
+                    }
+                }
+            }
+        },
+        "canvas_state": {
+            "type": "object",
+            "properties": {
+                "zoom_level": {"type": "number", "minimum": 0.1, "maximum": 5.0},
+                "pan_offset": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"}
                     }
                 },
-                "canvas_state": {
+                "viewport": {
                     "type": "object",
                     "properties": {
-                        "zoom_level": {"type": "number", "minimum": 0.1, "maximum": 5.0},
-                        "pan_offset": {
-                            "type": "object",
-                            "properties": {
-                                "x": {"type": "number"},
-                                "y": {"type": "number"}
-                            }
-                        },
-                        "viewport": {
-                            "type": "object",
-                            "properties": {
-                                "width": {"type": "number"},
-                                "height": {"type": "number"}
-                            }
-                        }
+                        "width": {"type": "number"},
+                        "height": {"type": "number"}
                     }
                 }
             }
         }
+    }
+}
+
+def _compile_validator(schema: Dict[str, Any]):
+    """Check the schema once and build a reusable jsonschema validator for it."""
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+# Shared by every serializer instance; the schema never changes
+_VALIDATOR = _compile_validator(_WORKFLOW_SCHEMA)
+
+# Set to route every validation through the general schema validator (parity checks)
+_GENERIC_VALIDATION = bool(os.environ.get("WORKFLOW_GENERIC_VALIDATION"))
+
+_UUID_RE = re.compile(_UUID_PATTERN)
+_VERSION_RE = re.compile(_WORKFLOW_SCHEMA["properties"]["version"]["pattern"])
+_NUMBER_TYPES = frozenset((int, float))
+
+def _is_valid_pins(pins: Any, check_required: bool) -> bool:
+    """Check a node's input or output pin list against the schema."""
+    if type(pins) is not list:
+        return False
+    for pin in pins:
+        if type(pin) is not dict:
+            return False
+        if type(pin.get("name")) is not str or type(pin.get("type")) is not str:
+            return False
+        if "description" in pin and type(pin["description"]) is not str:
+            return False
+        if check_required and "required" in pin and type(pin["required"]) is not bool:
+            return False
+    return True
+
+def _is_valid_node(node: Any) -> bool:
+    """Check a single serialized node against the schema."""
+    if type(node) is not dict:
+        return False
+    node_type = node.get("type")
+    if type(node.get("id")) is not str or type(node_type) is not str or not node_type:
+        return False
+    position = node.get("position")
+    if (type(position) is not dict
+            or type(position.get("x")) not in _NUMBER_TYPES
+            or type(position.get("y")) not in _NUMBER_TYPES):
+        return False
+    if "title" in node and type(node["title"]) is not str:
+        return False
+    if "properties" in node and type(node["properties"]) is not dict:
+        return False
+    if "inputs" in node and not _is_valid_pins(node["inputs"], True):
+        return False
+    if "outputs" in node and not _is_valid_pins(node["outputs"], False):
+        return False
+    return True
+
+def _is_valid_connection(connection: Any) -> bool:
+    """Check a single serialized connection against the schema."""
+    if type(connection) is not dict:
+        return False
+    for key in ("from_node", "from_pin", "to_node", "to_pin"):
+        if type(connection.get(key)) is not str:
+            return False
+    if "metadata" in connection and type(connection["metadata"]) is not dict:
+        return False
+    return True
+
+def _is_valid_point(point: Any, x_key: str, y_key: str) -> bool:
+    """Check an object whose two optional coordinates must be numbers."""
+    if type(point) is not dict:
+        return False
+    if x_key in point and type(point[x_key]) not in _NUMBER_TYPES:
+        return False
+    if y_key in point and type(point[y_key]) not in _NUMBER_TYPES:
+        return False
+    return True
+
+def _is_valid_workflow(workflow_data: Any) -> bool:
+    """Check workflow data against _WORKFLOW_SCHEMA with specialized inline checks.
+    
+    Only decides validity: anything unusual (including valid data of
+    uncommon types) returns False, and callers then ask the general
+    validator for the error messages.
+    """
+    if type(workflow_data) is not dict:
+        return False
+    
+    version = workflow_data.get("version")
+    if type(version) is not str or not _VERSION_RE.search(version):
+        return False
+    
+    metadata = workflow_data.get("metadata")
+    if type(metadata) is not dict:
+        return False
+    name = metadata.get("name")
+    if type(name) is not str or not name or type(metadata.get("created_at")) is not str:
+        return False
+    for key in ("description", "author", "modified_at"):
+        if key in metadata and type(metadata[key]) is not str:
+            return False
+    if "tags" in metadata:
+        tags = metadata["tags"]
+        if type(tags) is not list:
+            return False
+        for tag in tags:
+            if type(tag) is not str:
+                return False
+    
+    nodes = workflow_data.get("nodes")
+    if type(nodes) is not dict:
+        return False
+    match_uuid = _UUID_RE.search
+    for node_id, node in nodes.items():
+        # Keys that are not UUIDs are not constrained by the schema
+        if type(node_id) is not str:
+            return False
+        if match_uuid(node_id) and not _is_valid_node(node):
+            return False
+    
+    if "connections" in workflow_data:
+        connections = workflow_data["connections"]
+        if type(connections) is not dict:
+            return False
+        for connection_id, connection in connections.items():
+            if type(connection_id) is not str:
+                return False
+            if match_uuid(connection_id) and not _is_valid_connection(connection):
+                return False
+    
+    if "canvas_state" in workflow_data:
+        canvas_state = workflow_data["canvas_state"]
+        if type(canvas_state) is not dict:
+            return False
+        if "zoom_level" in canvas_state:
+            zoom_level = canvas_state["zoom_level"]
+            if type(zoom_level) not in _NUMBER_TYPES or not 0.1 <= zoom_level <= 5.0:
+                return False
+        if "pan_offset" in canvas_state and not _is_valid_point(canvas_state["pan_offset"], "x", "y"):
+            return False
+        if "viewport" in canvas_state and not _is_valid_point(canvas_state["viewport"], "width", "height"):
+            return False
+    
+    return True
+
+# Message templates for (code, *args) validation errors, rendered by format_error
+_ERROR_MESSAGES = {
+    "schema": "Schema validation error: %s",
+    "missing_from_node": "Connection %s: Source node '%s' not found",
+    "missing_to_node": "Connection %s: Target node '%s' not found",
+    "duplicate_position": "Nodes %s and %s have identical positions",
+}
+
+def format_error(error: tuple) -> str:
+    """Render a (code, *args) validation error as a readable message."""
+    return _ERROR_MESSAGES[error[0]] % error[1:]
+
+def _schema_errors(workflow_data: Dict[str, Any]) -> List[tuple]:
+    """Validate workflow data against the schema and return error tuples.
+    
+    Valid workflows are accepted by _is_valid_workflow alone; the jsonschema
+    validator only runs to report what is wrong, as the single best-matching
+    error (what jsonschema.validate raises).
+    """
+    if not _GENERIC_VALIDATION and _is_valid_workflow(workflow_data):
+        return []
+    
+    error = jsonschema.exceptions.best_match(_VALIDATOR.iter_errors(workflow_data))
+    return [] if error is None else [("schema", error.message)]
+
+# Property value types written to JSON unchanged
+_JSON_TYPES = (str, int, float, bool, list, dict, type(None))
+_JSON_TYPES_SET = frozenset(_JSON_TYPES)
+
+# Fixed sections of the text summary
+_SUMMARY_HEADER = "WORKFLOW SUMMARY\n" + "=" * 50 + "\n"
+_SUMMARY_NODES_HEADER = "NODES:\n" + "-" * 20
+_SUMMARY_CONNECTIONS_HEADER = "\n\nCONNECTIONS:\n" + "-" * 20
+
+# Static metadata defaults; serialize_workflow adds timestamps and tags
+_DEFAULT_METADATA = {
+    "name": "Untitled Workflow",
+    "description": "",
+    "author": ""
+}
+
+# Schema-valid stand-in metadata for validating a node graph on its own
+_PLACEHOLDER_METADATA = {"name": "placeholder", "created_at": ""}
+
+# Node fields copied through as-is when present, in serialized order
+_NODE_OPTIONAL_FIELDS = ("title", "properties", "inputs", "outputs")
+
+class WorkflowSerializer:
+    """Handles workflow serialization with validation and versioning."""
+    
+    schema = _WORKFLOW_SCHEMA
+    
+    def __init__(self):
+        """Initialize the serializer."""
+        self.current_version = "1.0"
+        self._current_major = int(self.current_version.split('.', 1)[0])
+        
+        # Serialized nodes keyed by id as (node_data, revision, serialized_node)
+        self._node_cache: Dict[str, tuple] = {}
+        # (nodes, revision, errors) of the last node graph validated by
+        # serialize_workflow; nodes is held so its identity cannot be reused
+        self._validated_graph: Optional[tuple] = None
+        self._last_validation_errors: List[tuple] = []
+        # Absolute path -> (mtime_ns, size) of files this serializer wrote after a clean validation
+        self._trusted_files: Dict[str, tuple] = {}
     
     def serialize_workflow(self, workflow_data: Dict[str, Any], 
                           metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Serialize workflow data to a standardized format."""
-        # Prepare metadata
-        now = datetime.now().isoformat()
-        default_metadata = {
-            "name": "Untitled Workflow",
-            "description": "",
-            "author": "",
-            "created_at": now,
-            "modified_at": now,
-            "tags": []
-        }
+        # Prepare metadata (tags get a fresh list so callers never share one)
+        default_metadata = _DEFAULT_METADATA.copy()
+        default_metadata["created_at"] = default_metadata["modified_at"] = _now_iso()
+        default_metadata["tags"] = []
         
         if metadata:
             default_metadata.update(metadata)
         
         # Build serialized workflow
+        nodes = workflow_data.get("nodes", {})
         serialized = {
             "version": self.current_version,
             "metadata": default_metadata,
-            "nodes": self._serialize_nodes(workflow_data.get("nodes", {})),
+            "nodes": self._serialize_nodes(nodes, workflow_data.get("node_revisions")),
             "connections": self._serialize_connections(workflow_data.get("connections", {})),
             "canvas_state": workflow_data.get("canvas_state", {})
         }
         
-        # Validate against schema
-        self.validate_workflow(serialized)
+        # Validate against schema in two parts: the small metadata and canvas
+        # sections every time, the node graph only when its revision changed
+        revision = workflow_data.get("revision")
+        validated = self._validated_graph
+        if (revision is None or validated is None
+                or validated[0] is not nodes or validated[1] != revision):
+            graph_errors = self.validate_workflow_codes({
+                "version": serialized["version"],
+                "metadata": _PLACEHOLDER_METADATA,
+                "nodes": serialized["nodes"],
+                "connections": serialized["connections"]
+            })
+            self._validated_graph = None if revision is None else (nodes, revision, graph_errors)
+        else:
+            graph_errors = validated[2]
+        
+        header_errors = self.validate_workflow_codes({
+            "version": serialized["version"],
+            "metadata": serialized["metadata"],
+            "nodes": {},
+            "canvas_state": serialized["canvas_state"]
+        })
+        self._last_validation_errors = header_errors + graph_errors
         
         return serialized
     
-    def _serialize_nodes(self, nodes: Dict[str, Any]) -> Dict[str, Any]:
-        """Serialize nodes with proper structure."""
+    def _serialize_nodes(self, nodes: Dict[str, Any],
+                         node_revisions: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Serialize nodes with proper structure.
+        
+        With node_revisions (bumped by the editor on in-place edits), nodes
+        whose data object and revision are unchanged reuse their last result.
+        """
         serialized_nodes = {}
+        node_cache = self._node_cache if node_revisions is not None else None
         
         for node_id, node_data in nodes.items():
+            if node_cache is not None:
+                revision = node_revisions.get(node_id, 0)
+                cached = node_cache.get(node_id)
+                if cached is not None and cached[0] is node_data and cached[1] == revision:
+                    serialized_nodes[node_id] = cached[2]
+                    continue
+            
             serialized_node = {
                 "id": node_id,
                 "type": node_data.get("type", "unknown"),
-                "position": node_data.get("position", {"x": 0, "y": 0}),
+                "position": node_data["position"] if "position" in node_data else {"x": 0, "y": 0},
+                # Optional fields
+                **{key: node_data[key] for key in _NODE_OPTIONAL_FIELDS if key in node_data}
             }
             
-            # Optional fields
-            if "title" in node_data:
-                serialized_node["title"] = node_data["title"]
-            
-            if "properties" in node_data:
-                serialized_node["properties"] = self._serialize_properties(node_data["properties"])
-            
-            if "inputs" in node_data:
-                serialized_node["inputs"] = node_data["inputs"]
-            
-            if "outputs" in node_data:
-                serialized_node["outputs"] = node_data["outputs"]
+            if "properties" in serialized_node:
+                serialized_node["properties"] = self._serialize_properties(serialized_node["properties"])
             
             serialized_nodes[node_id] = serialized_node
+            if node_cache is not None:
+                node_cache[node_id] = (node_data, revision, serialized_node)
+        
+        # Forget deleted nodes
+        if node_cache is not None and len(node_cache) > len(serialized_nodes):
+            for node_id in [node_id for node_id in node_cache if node_id not in serialized_nodes]:
+                del node_cache[node_id]
         
         return serialized_nodes
     
     def _serialize_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Serialize node properties with type preservation."""
+        # Common case: every value is already JSON-native, so nothing to convert.
+        # Still copied: the result is cached and must not track later canvas edits
+        if all(type(value) in _JSON_TYPES_SET for value in properties.values()):
+            return dict(properties)
+        
         serialized_props = {}
         
         for key, value in properties.items():
             # Handle different property types
-            if isinstance(value, (str, int, float, bool, list, dict)):
+            if isinstance(value, _JSON_TYPES):
                 serialized_props[key] = value
             else:
                 # Convert complex types to string representation
@@ -225,15 +534,20 @@ class WorkflowSerializer:
         
         return serialized_connections
     
-    def deserialize_workflow(self, serialized_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deserialize workflow data from JSON format."""
-        # Validate against schema
-        self.validate_workflow(serialized_data)
-        
-        # Check version compatibility
-        version = serialized_data.get("version", "1.0")
-        if not self._is_version_compatible(version):
-            raise ValueError(f"Incompatible workflow version: {version}")
+    def deserialize_workflow(self, serialized_data: Dict[str, Any],
+                             validate: bool = True) -> Dict[str, Any]:
+        """Deserialize workflow data from JSON format.
+        
+        Pass validate=False for trusted data to skip the schema and version checks.
+        """
+        if validate:
+            # Validate against schema
+            self.validate_workflow_codes(serialized_data)
+            
+            # Check version compatibility
+            version = serialized_data.get("version", "1.0")
+            if not self._is_version_compatible(version):
+                raise ValueError(f"Incompatible workflow version: {version}")
         
         # Extract workflow components
         workflow_data = {
@@ -252,21 +566,13 @@ class WorkflowSerializer:
         for node_id, node_data in nodes_data.items():
             deserialized_node = {
                 "type": node_data.get("type", "unknown"),
-                "position": node_data.get("position", {"x": 0, "y": 0})
+                "position": node_data["position"] if "position" in node_data else {"x": 0, "y": 0},
+                # Optional fields
+                **{key: node_data[key] for key in _NODE_OPTIONAL_FIELDS if key in node_data}
             }
             
-            # Optional fields
-            if "title" in node_data:
-                deserialized_node["title"] = node_data["title"]
-            
-            if "properties" in node_data:
-                deserialized_node["properties"] = self._deserialize_properties(node_data["properties"])
-            
-            if "inputs" in node_data:
-                deserialized_node["inputs"] = node_data["inputs"]
-            
-            if "outputs" in node_data:
-                deserialized_node["outputs"] = node_data["outputs"]
+            if "properties" in deserialized_node:
+                deserialized_node["properties"] = self._deserialize_properties(deserialized_node["properties"])
             
             deserialized_nodes[node_id] = deserialized_node
         
@@ -276,22 +582,23 @@ class WorkflowSerializer:
         """Deserialize node properties with type restoration."""
         # For now, return as-is since JSON preserves basic types
         # This could be extended for complex type restoration
-        return properties.copy()
+        # The dict is shared with the serialized data, which callers parse fresh
+        return properties
     
     def _deserialize_connections(self, connections_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deserialize connections."""
-        return connections_data.copy()
+        """Deserialize connections (shared with the serialized data, not copied)."""
+        return connections_data
     
     def validate_workflow(self, workflow_data: Dict[str, Any]) -> List[str]:
-        """Validate workflow against schema and return errors."""
-        errors = []
+        """Validate workflow against schema and return error messages."""
+        return [format_error(error) for error in self.validate_workflow_codes(workflow_data)]
+    
+    def validate_workflow_codes(self, workflow_data: Dict[str, Any]) -> List[tuple]:
+        """Validate workflow against schema and return (code, *args) error tuples.
         
-        try:
-            jsonschema.validate(workflow_data, self.schema)
-        except jsonschema.ValidationError as e:
-            errors.append(f"Schema validation error: {e.message}")
-        except jsonschema.SchemaError as e:
-            errors.append(f"Schema error: {e.message}")
+        For callers that only count or inspect errors; see format_error.
+        """
+        errors = _schema_errors(workflow_data)
         
         # Additional custom validations
         custom_errors = self._perform_custom_validations(workflow_data)
@@ -299,32 +606,51 @@ class WorkflowSerializer:
         
         return errors
     
-    def _perform_custom_validations(self, workflow_data: Dict[str, Any]) -> List[str]:
-        """Perform custom validations beyond schema."""
+    def validate_many(self, workflows: Iterable[Dict[str, Any]]) -> List[List[str]]:
+        """Validate several workflows, returning one error list per workflow.
+        
+        Preferred over repeated validate_workflow calls when scanning many
+        files: all of them run through the one shared compiled validator.
+        """
+        schema_errors = _schema_errors
+        custom_validations = self._perform_custom_validations
+        results = []
+        
+        for workflow_data in workflows:
+            errors = schema_errors(workflow_data)
+            errors.extend(custom_validations(workflow_data))
+            results.append([format_error(error) for error in errors] if errors else errors)
+        
+        return results
+    
+    def _perform_custom_validations(self, workflow_data: Dict[str, Any]) -> List[tuple]:
+        """Perform custom validations beyond schema, returning error tuples."""
         errors = []
         
         nodes = workflow_data.get("nodes", {})
         connections = workflow_data.get("connections", {})
         
-        # Check that all connection references exist
+        # Check that all connection references exist (against the set-like key view)
+        node_ids = nodes.keys()
         for connection_id, connection in connections.items():
             from_node = connection.get("from_node")
             to_node = connection.get("to_node")
             
-            if from_node not in nodes:
-                errors.append(f"Connection {connection_id}: Source node '{from_node}' not found")
+            if from_node not in node_ids:
+                errors.append(("missing_from_node", connection_id, from_node))
             
-            if to_node not in nodes:
-                errors.append(f"Connection {connection_id}: Target node '{to_node}' not found")
+            if to_node not in node_ids:
+                errors.append(("missing_to_node", connection_id, to_node))
         
         # Check for duplicate node positions (potential overlaps)
         positions = {}
         for node_id, node in nodes.items():
-            pos = node.get("position", {})
-            pos_key = f"{pos.get('x', 0)},{pos.get('y', 0)}"
+            pos = node.get("position") or {}
+            pos_key = (pos.get("x", 0), pos.get("y", 0))
             
-            if pos_key in positions:
-                errors.append(f"Nodes {positions[pos_key]} and {node_id} have identical positions")
+            first_node_id = positions.get(pos_key)
+            if first_node_id is not None:
+                errors.append(("duplicate_position", first_node_id, node_id))
             else:
                 positions[pos_key] = node_id
         
@@ -333,39 +659,79 @@ class WorkflowSerializer:
     def _is_version_compatible(self, version: str) -> bool:
         """Check if workflow version is compatible."""
         try:
-            major, minor = map(int, version.split('.'))
-            current_major, current_minor = map(int, self.current_version.split('.'))
+            major, minor = version.split('.')
+            int(minor)
             
             # Same major version is compatible
-            return major == current_major
-        except (ValueError, IndexError):
+            return int(major) == self._current_major
+        except (ValueError, AttributeError):
             return False
     
     def save_to_file(self, workflow_data: Dict[str, Any], file_path: str,
                      metadata: Optional[Dict[str, Any]] = None):
         """Save workflow to JSON file."""
+        _write_indented(self._serialize_for_file(workflow_data, metadata), file_path)
+        
+        self.mark_trusted(file_path)
+    
+    def mark_trusted(self, file_path: str, stat: Optional[os.stat_result] = None):
+        """Record a file just written from the last serialized workflow.
+        
+        If that workflow validated cleanly, load_from_file skips revalidating
+        the file while its mtime and size are unchanged. Pass stat if the
+        caller already has it for the written file.
+        """
+        path = os.path.abspath(file_path)
+        if self._last_validation_errors:
+            self._trusted_files.pop(path, None)
+        else:
+            if stat is None:
+                stat = os.stat(path)
+            self._trusted_files[path] = (stat.st_mtime_ns, stat.st_size)
+    
+    def dump_bytes(self, workflow_data: Dict[str, Any],
+                   metadata: Optional[Dict[str, Any]] = None) -> bytes:
+        """Serialize workflow to the UTF-8 JSON bytes written by save_to_file."""
+        # Pretty formatting
+        return _dumps_indented(self._serialize_for_file(workflow_data, metadata))
+    
+    def _serialize_for_file(self, workflow_data: Dict[str, Any],
+                            metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Serialize workflow with its metadata stamped for saving."""
         # Update metadata with file information
         file_metadata = metadata or {}
-        file_metadata["modified_at"] = datetime.now().isoformat()
-        
-        serialized = self.serialize_workflow(workflow_data, file_metadata)
+        file_metadata["modified_at"] = _now_iso()
         
-        # Write to file with pretty formatting
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(serialized, f, indent=2, ensure_ascii=False)
+        return self.serialize_workflow(workflow_data, file_metadata)
+    
+    def save_bytes(self, blob: bytes, file_path: str):
+        """Write already serialized workflow bytes to a file."""
+        with open(file_path, 'wb') as f:
+            f.write(blob)
+        self._trusted_files.pop(os.path.abspath(file_path), None)
     
     def load_from_file(self, file_path: str) -> Dict[str, Any]:
         """Load workflow from JSON file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            serialized_data = json.load(f)
+        path = Path(file_path)
+        stat = path.stat()
+        
+        if ijson is not None and stat.st_size >= _STREAM_LOAD_MIN_BYTES:
+            # Build the top-level entries straight from the parser without
+            # holding the raw file contents in memory as well
+            with open(path, 'rb') as f:
+                serialized_data = dict(ijson.kvitems(f, '', use_float=True))
+        else:
+            serialized_data = _loads(path.read_bytes())
         
-        return self.deserialize_workflow(serialized_data)
+        # Files saved here after a clean validation and unchanged since need no recheck
+        trusted = self._trusted_files.get(os.path.abspath(file_path)) == (stat.st_mtime_ns, stat.st_size)
+        return self.deserialize_workflow(serialized_data, validate=not trusted)
     
     def export_to_format(self, workflow_data: Dict[str, Any], format_type: str) -> str:
         """Export workflow to different formats."""
         if format_type == "json":
             serialized = self.serialize_workflow(workflow_data)
-            return json.dumps(serialized, indent=2)
+            return _dumps_indented(serialized).decode('utf-8')
         
         elif format_type == "yaml":
             try:
@@ -387,36 +753,29 @@ class WorkflowSerializer:
         connections = workflow_data.get("connections", {})
         metadata = workflow_data.get("metadata", {})
         
-        summary = []
-        summary.append("WORKFLOW SUMMARY")
-        summary.append("=" * 50)
-        summary.append(f"Name: {metadata.get('name', 'Untitled')}")
-        summary.append(f"Description: {metadata.get('description', 'No description')}")
-        summary.append(f"Nodes: {len(nodes)}")
-        summary.append(f"Connections: {len(connections)}")
-        summary.append("")
+        buf = io.StringIO()
+        write = buf.write
+        
+        write(_SUMMARY_HEADER)
+        write("Name: %s\n" % (metadata.get('name', 'Untitled'),))
+        write("Description: %s\n" % (metadata.get('description', 'No description'),))
+        write("Nodes: %d\nConnections: %d\n\n" % (len(nodes), len(connections)))
         
         # Node details
-        summary.append("NODES:")
-        summary.append("-" * 20)
+        write(_SUMMARY_NODES_HEADER)
         for node_id, node in nodes.items():
             node_type = node.get("type", "unknown")
-            node_title = node.get("title", node_type)
-            summary.append(f"  {node_title} ({node_type}) - {node_id[:8]}...")
-        
-        summary.append("")
+            write("\n  %s (%s) - %s..." % (node.get("title", node_type), node_type, node_id[:8]))
         
         # Connection details
-        summary.append("CONNECTIONS:")
-        summary.append("-" * 20)
-        for connection_id, connection in connections.items():
-            from_node = connection.get("from_node", "")[:8]
-            to_node = connection.get("to_node", "")[:8]
-            from_pin = connection.get("from_pin", "")
-            to_pin = connection.get("to_pin", "")
-            summary.append(f"  {from_node}...{from_pin} -> {to_node}...{to_pin}")
-        
-        return "\n".join(summary)
+        write(_SUMMARY_CONNECTIONS_HEADER)
+        for connection in connections.values():
+            write("\n  %s...%s -> %s...%s" % (
+                connection.get("from_node", "")[:8], connection.get("from_pin", ""),
+                connection.get("to_node", "")[:8], connection.get("to_pin", "")
+            ))
+        
+        return buf.getvalue()
     
     def create_workflow_template(self, name: str, description: str = "") -> Dict[str, Any]:
         """Create an empty workflow template."""
@@ -426,8 +785,8 @@ class WorkflowSerializer:
                 "name": name,
                 "description": description,
                 "author": "",
-                "created_at": datetime.now().isoformat(),
-                "modified_at": datetime.now().isoformat(),
+                "created_at": _now_iso(),
+                "modified_at": _now_iso(),
                 "tags": []
             },
             "nodes": {},